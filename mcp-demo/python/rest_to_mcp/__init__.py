@@ -7,6 +7,7 @@ from .adapter import (
     create_jsonplaceholder_adapter,
     create_multi_api_adapter,
 )
+from .cache import RestCacheConfig
 from .config import (
     HTTP_ERROR_THRESHOLD,
     HTTP_TIMEOUT_SECONDS,
@@ -54,6 +55,7 @@ __all__ = [
     "HttpMethod",
     "create_jsonplaceholder_adapter",
     "create_multi_api_adapter",
+    "RestCacheConfig",
     # Endpoints
     "JSONPLACEHOLDER_ENDPOINTS",
     "OPEN_METEO_ENDPOINTS",
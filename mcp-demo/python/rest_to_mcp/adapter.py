@@ -12,17 +12,23 @@ The adapter:
 
 from __future__ import annotations
 
-import json
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
 from types import MappingProxyType
 from typing import Any, Mapping
 
 import httpx
 from pydantic import ValidationError as PydanticValidationError
 
+from .cache import CallKey, ResponseCache, RestCacheConfig
 from .config import (
     HTTP_ERROR_THRESHOLD,
+    HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
     HTTP_TIMEOUT_SECONDS,
     JSONPLACEHOLDER_BASE_URL,
+    TOOL_BATCH_CONCURRENCY,
 )
 from .endpoints import (
     DEFAULT_ENDPOINTS,
@@ -31,8 +37,11 @@ from .endpoints import (
     RestEndpoint,
 )
 from .errors import ContractViolation, GatewayFailure, GatewayInternalFailure, TransportFailure
+from .guards import DESTRUCTIVE_OPERATION_GUARDS, Guard
+from .json_codec import JSONDecodeError, dumps_canonical, reindent
 from .models import (
     ContentBlock,
+    ContentBlockDict,
     ContextError,
     ErrorCode,
     ExecutionContext,
@@ -45,6 +54,7 @@ from .models import (
     Tool,
     ToolCallParams,
     ToolCallResult,
+    ToolCallResultDict,
     ToolTimeoutError,
     ToolValidationError,
     make_error_response,
@@ -68,6 +78,32 @@ __all__ = [
 from .endpoints import OPEN_METEO_ENDPOINTS
 from .config import OPEN_METEO_BASE_URL as OPEN_METEO_BASE
 
+_MethodHandler = Callable[
+    [JsonRpcRequest, ExecutionContext],
+    Awaitable[tuple[JsonRpcResponse | JsonRpcErrorResponse, ExecutionContext]],
+]
+
+# Field names ToolCallParams accepts (extra="forbid" rejects anything else)
+_TOOL_CALL_PARAM_FIELDS = frozenset(ToolCallParams.model_fields)
+
+# Server capabilities are constant for the process; dump once, not per request.
+_INITIALIZE_RESULT_DUMP: dict[str, Any] = InitializeResult().model_dump()
+
+
+def _dump_tool_call_result(result: ToolCallResult) -> ToolCallResultDict:
+    """
+    Equivalent of result.model_dump(), hand-built for the common case.
+
+    Tool results are almost always text-only; building that dict directly
+    skips pydantic's serializer. Any other block type takes model_dump().
+    """
+    content: list[ContentBlockDict] = []
+    for block in result.content:
+        if type(block) is not TextContent:
+            return result.model_dump()  # type: ignore[return-value]
+        content.append({"type": "text", "text": block.text})
+    return {"content": content, "isError": result.isError}
+
 
 class RestToMcpAdapter:
     """
@@ -83,10 +119,42 @@ class RestToMcpAdapter:
     as MCP-compliant tool servers.
     """
 
-    def __init__(self, base_url: str, endpoints: list[RestEndpoint] | None = None):
+    def __init__(
+        self,
+        base_url: str,
+        endpoints: list[RestEndpoint] | None = None,
+        cache_config: RestCacheConfig | None = None,
+        pretty: bool = False,
+        guards: Mapping[str, Sequence[Guard]] = DESTRUCTIVE_OPERATION_GUARDS,
+        limits: httpx.Limits | None = None,
+        http2: bool = True,
+    ):
         self.base_url = base_url.rstrip("/")
+
+        # Upstream pool settings, applied when the client is first created
+        self._limits = limits or httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        )
+        self._http2 = http2
+
+        # pretty=False passes upstream JSON text through verbatim.
+        # pretty=True re-indents it (one decode + encode per call).
+        self.pretty = pretty
         self._client: httpx.AsyncClient | None = None
 
+        # Response cache is disabled unless a config is supplied.
+        self._cache: ResponseCache | None = (
+            ResponseCache(cache_config)
+            if cache_config is not None and cache_config.enabled
+            else None
+        )
+
+        # Single-flight map: identical concurrent GET calls share one upstream
+        # request. Entries live only while the shared call is in flight.
+        self._inflight: dict[CallKey, asyncio.Task[ToolCallResult]] = {}
+
         # Build registry during initialization
         registry: dict[str, RestEndpoint] = {}
         for endpoint in endpoints or []:
@@ -97,6 +165,32 @@ class RestToMcpAdapter:
         # There is no unfreeze. There is no runtime toggle. Structure enforces policy.
         self._endpoints: Mapping[str, RestEndpoint] = MappingProxyType(registry)
 
+        # Guards are resolved once against the frozen registry, so orchestration
+        # does a single lookup per call instead of comparing tool names.
+        self._guards: Mapping[str, tuple[Guard, ...]] = MappingProxyType({
+            name: tuple(tool_guards)
+            for name, tool_guards in guards.items()
+            if name in registry and tool_guards
+        })
+
+        # The registry is frozen, so the tools/list payload is fixed too.
+        # Materialize it once instead of rebuilding models per request.
+        self._tools: tuple[Tool, ...] = tuple(
+            endpoint.to_mcp_tool() for endpoint in registry.values()
+        )
+        self._tools_list_dump: dict[str, Any] = ListToolsResult(
+            tools=list(self._tools)
+        ).model_dump()
+
+        # ROUTING TABLE: Fixed method → handler map. Like the registry, it is
+        # built once and never modified. Anything else falls through to
+        # _handle_unknown_method (METHOD_NOT_FOUND).
+        self._dispatch: Mapping[str, _MethodHandler] = MappingProxyType({
+            "initialize": self._handle_initialize,
+            "tools/list": self._handle_tools_list,
+            "tools/call": self._handle_tools_call,
+        })
+
     @property
     def endpoints(self) -> Mapping[str, RestEndpoint]:
         """Read-only access to the frozen tool registry."""
@@ -104,11 +198,19 @@ class RestToMcpAdapter:
 
     @property
     def client(self) -> httpx.AsyncClient:
-        """Lazy-initialize HTTP client."""
+        """
+        Lazy-initialize HTTP client.
+
+        One pooled client per adapter. Keep-alive connections are reused
+        across tool calls, and HTTP/2 multiplexes concurrent calls to the
+        same host over a single connection.
+        """
         if self._client is None:
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
                 timeout=HTTP_TIMEOUT_SECONDS,
+                limits=self._limits,
+                http2=self._http2,
             )
         return self._client
 
@@ -118,9 +220,15 @@ class RestToMcpAdapter:
             await self._client.aclose()
             self._client = None
 
+    async def __aenter__(self) -> RestToMcpAdapter:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
     def _list_tools(self) -> list[Tool]:
         """Return all registered tools in MCP format. Internal use only."""
-        return [endpoint.to_mcp_tool() for endpoint in self.endpoints.values()]
+        return list(self._tools)
 
     async def _call_tool(self, name: str, arguments: dict[str, Any]) -> ToolCallResult:
         """
@@ -141,23 +249,94 @@ class RestToMcpAdapter:
         # AMBIGUITY HARD-FAIL: Unknown tool is a contract violation.
         # Per FAILURE_MODEL.md: "Unknown tool name → Fail with INVALID_PARAMS"
         # This should never happen if orchestration validates correctly.
-        if name not in self.endpoints:
+        endpoint = self._endpoints.get(name)
+        if endpoint is None:
             raise ContractViolation(f"Unknown tool: {name}")
 
-        endpoint = self.endpoints[name]
-        url = self._build_url(endpoint, arguments)
-        query_params = self._build_query_params(endpoint, arguments)
-        body = self._build_body(endpoint, arguments)
+        # Mutating methods are never coalesced or cached: each call must reach
+        # upstream. A mutation may also stale any cached read, so drop them all,
+        # both before and after it: a read in flight meanwhile could otherwise
+        # store pre-mutation data. Each clear() also bumps the cache generation,
+        # so reads that started before it skip their put().
+        if endpoint.method != HttpMethod.GET:
+            if self._cache is None:
+                return await self._execute_tool(name, endpoint, arguments)
+            self._cache.clear()
+            try:
+                return await self._execute_tool(name, endpoint, arguments)
+            finally:
+                self._cache.clear()
+
+        # Tuple key: no string concatenation, and no way for a tool name to
+        # collide with an argument encoding
+        key = (name, dumps_canonical(arguments))
+        cache = self._cache if self._cache is not None and self._cache.accepts(name) else None
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return ToolCallResult(content=list(cached))
+
+        # SINGLE-FLIGHT: The upstream call runs in its own task, which every
+        # caller (leader included) awaits through shield(). A cancelled caller
+        # only stops waiting; the shared call keeps running for the others.
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            generation = cache.generation if cache is not None else 0
+            inflight = asyncio.create_task(
+                self._execute_shared(key, name, endpoint, arguments, cache, generation)
+            )
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda task: self._end_flight(key, task))
+        return await asyncio.shield(inflight)
+
+    async def _execute_shared(
+        self,
+        key: CallKey,
+        name: str,
+        endpoint: RestEndpoint,
+        arguments: dict[str, Any],
+        cache: ResponseCache | None,
+        generation: int,
+    ) -> ToolCallResult:
+        """
+        Body of a single-flight task: one upstream call, cached on success.
+
+        generation is the cache generation read before the call started; a
+        mutation since then means the result may predate it, so it is not
+        stored.
+        """
+        result = await self._execute_tool(name, endpoint, arguments)
+        # Only successful responses are cached; errors must be retried.
+        if cache is not None and not result.isError:
+            cache.put(key, result.content, generation)
+        return result
+
+    def _end_flight(self, key: CallKey, task: asyncio.Task[ToolCallResult]) -> None:
+        """Drop a finished single-flight task from the in-flight map."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark retrieved: if every caller was cancelled, nobody reads it
+            task.exception()
+
+    async def _execute_tool(
+        self, name: str, endpoint: RestEndpoint, arguments: dict[str, Any]
+    ) -> ToolCallResult:
+        """Make the HTTP call for a resolved endpoint and wrap the response."""
+        # One pass over arguments classifies every value by destination
+        path_values, query_params, body_values = endpoint.partition_arguments(arguments)
+        url = self._build_url(endpoint, path_values)
+        body = self._build_body(endpoint, body_values)
 
         try:
             response = await self.client.request(
-                method=endpoint.method.value,
+                method=endpoint._method_str,
                 url=url,
                 params=query_params or None,
                 json=body,
             )
 
-            content = self._response_to_content(response)
+            content = self._response_to_content(response, endpoint.pretty)
             return ToolCallResult(
                 content=content,
                 isError=response.status_code >= HTTP_ERROR_THRESHOLD,
@@ -184,41 +363,29 @@ class RestToMcpAdapter:
                 isError=True,
             )
 
-    def _build_url(self, endpoint: RestEndpoint, arguments: dict[str, Any]) -> str:
+    def _build_url(self, endpoint: RestEndpoint, path_values: dict[str, Any]) -> str:
         """Build URL with path parameters substituted."""
         # EARLY AMBIGUITY CHECK: Detect missing params BEFORE any transformation
-        # Path params are always required - cannot build URL with holes
-        if endpoint.path_params:
-            missing = [p for p in endpoint.path_params if p not in arguments]
+        # Path params are always required - cannot build URL with holes.
+        # Length check first: the common (complete) case costs no scan.
+        if len(path_values) != len(endpoint.path_params or ()):
+            missing = [p for p in endpoint.path_params or () if p not in path_values]
             if missing:
                 raise ContractViolation(
                     f"Cannot build URL: missing required path parameter(s): {missing}"
                 )
 
         # Only substitute after confirming all params present
-        path = endpoint.path
-        for param in endpoint.path_params or []:
-            path = path.replace(f"{{{param}}}", str(arguments[param]))
-
-        # Use endpoint-specific base_url if provided (multi-API support)
-        if endpoint.base_url:
-            return endpoint.base_url.rstrip("/") + path
-        return path  # Relative to adapter's base_url
-
-    def _build_query_params(
-        self, endpoint: RestEndpoint, arguments: dict[str, Any]
-    ) -> dict[str, Any]:
-        """Build query parameters from arguments."""
-        query_params = {}
-        for param in endpoint.query_params or []:
-            if param in arguments:
-                query_params[param] = arguments[param]
-        return query_params
+        path = endpoint.render_path(path_values)
+
+        # Use endpoint-specific base_url if provided (multi-API support);
+        # otherwise the prefix is empty and the path is relative to ours
+        return endpoint._absolute_base + path
 
     def _build_body(
-        self, endpoint: RestEndpoint, arguments: dict[str, Any]
+        self, endpoint: RestEndpoint, body_values: dict[str, Any]
     ) -> dict[str, Any] | None:
-        """Build request body from arguments."""
+        """Build request body from the body-classified arguments."""
         if not endpoint.body_params:
             return None
 
@@ -231,28 +398,53 @@ class RestToMcpAdapter:
         # - Current behavior: silently skip missing params (partial body)
         # - Alternative: fail on any missing body param
         # This silent classification should be replaced with explicit policy.
-        missing = [k for k in endpoint.body_params if k not in arguments]
-        if missing:
-            raise ContractViolation(
-                f"Cannot build request body: missing body parameter(s): {missing}"
-            )
+        if len(body_values) != len(endpoint.body_params):
+            missing = [k for k in endpoint.body_params if k not in body_values]
+            if missing:
+                raise ContractViolation(
+                    f"Cannot build request body: missing body parameter(s): {missing}"
+                )
 
-        return {k: arguments[k] for k in endpoint.body_params}
+        return body_values
 
-    def _response_to_content(self, response: httpx.Response) -> list[ContentBlock]:
-        """Convert HTTP response to MCP content blocks."""
+    def _response_to_content(
+        self, response: httpx.Response, pretty: bool | None = None
+    ) -> list[ContentBlock]:
+        """
+        Convert HTTP response to MCP content blocks.
+
+        pretty overrides the adapter-wide setting for one endpoint.
+        """
         # TODO: UNDECIDED per docs/FAILURE_MODEL.md (Issue #21)
         # - Should empty upstream responses be treated as errors?
         # - Should partial upstream responses (missing expected fields) hard-fail?
         # - How should non-JSON upstream responses be categorized?
         # Currently: non-JSON falls back to raw text, empty responses accepted.
         # This is ambiguity tolerance that requires an architectural decision.
+
+        # AMBIGUITY: Non-JSON response - treating as raw text.
+        # Decided from the declared content-type, not by attempting a parse,
+        # so HTML error pages and plain text never pay for a failed decode.
+        # TODO: UNDECIDED - should this raise UpstreamFailure instead?
+        if "json" not in response.headers.get("content-type", ""):
+            return [TextContent(text=response.text)]
+
+        # Error bodies are reported verbatim: they are diagnostic text for the
+        # caller, and re-indenting them is wasted work on the failure path.
+        if response.status_code >= HTTP_ERROR_THRESHOLD:
+            return [TextContent(text=response.text)]
+
+        # Upstream already sent JSON: hand its text through unchanged rather
+        # than paying for a full parse + re-serialize.
+        if not (self.pretty if pretty is None else pretty):
+            return [TextContent(text=response.text)]
+
+        # Decode straight from the response bytes, exactly: re-indenting must
+        # not round wide integers the way an orjson decode would.
         try:
-            data = response.json()
-            text = json.dumps(data, indent=2)
-        except json.JSONDecodeError:
-            # AMBIGUITY: Non-JSON response - treating as raw text
-            # TODO: UNDECIDED - should this raise UpstreamFailure instead?
+            text = reindent(response.content)
+        except JSONDecodeError:
+            # AMBIGUITY: Declared JSON but malformed - treating as raw text
             text = response.text
 
         return [TextContent(text=text)]
@@ -287,36 +479,67 @@ class RestToMcpAdapter:
             # Create canonical context at entry point (single creation path)
             context = ExecutionContext.from_request(request)
 
-            match request.method:
-                case "initialize":
-                    response = make_success_response(
-                        request.id,
-                        InitializeResult().model_dump(),
-                    )
-                    return response, context.seal()
-
-                case "tools/list":
-                    list_result = ListToolsResult(tools=self._list_tools())
-                    response = make_success_response(request.id, list_result.model_dump())
-                    return response, context.seal()
-
-                case "tools/call":
-                    response, context = await self._handle_tools_call(request, context)
-                    return response, context.seal()
-
-                case _:
-                    response = make_error_response(
-                        request.id,
-                        ErrorCode.METHOD_NOT_FOUND,
-                        f"Unknown method: {request.method}",
-                    )
-                    return response, context.seal()
+            handler = self._dispatch.get(request.method, self._handle_unknown_method)
+            response, context = await handler(request, context)
+            return response, context.seal()
 
         except GatewayFailure:
             raise
         except Exception as e:
             raise GatewayInternalFailure(str(e), cause=e) from e
 
+    async def handle_batch(
+        self, requests: Sequence[JsonRpcRequest]
+    ) -> list[tuple[JsonRpcResponse | JsonRpcErrorResponse, ExecutionContext] | GatewayFailure]:
+        """
+        Handle a JSON-RPC 2.0 batch: many requests, one awaited fan-out.
+
+        This is NOT a second execution path. Every request still goes through
+        handle_request, so validation, guards and context sealing apply to each
+        item exactly as if it had been sent alone. Only the scheduling differs:
+        items run concurrently (at most TOOL_BATCH_CONCURRENCY in flight)
+        instead of one round-trip per request.
+
+        Results are returned in request order. A request whose handle_request
+        raises yields its GatewayFailure in place instead of aborting the
+        others, whose upstream calls may already have taken effect.
+        """
+        semaphore = asyncio.Semaphore(TOOL_BATCH_CONCURRENCY)
+
+        async def bounded(
+            request: JsonRpcRequest,
+        ) -> tuple[JsonRpcResponse | JsonRpcErrorResponse, ExecutionContext] | GatewayFailure:
+            async with semaphore:
+                try:
+                    return await self.handle_request(request)
+                except GatewayFailure as e:
+                    return e
+
+        return list(await asyncio.gather(*(bounded(r) for r in requests)))
+
+    async def _handle_initialize(
+        self, request: JsonRpcRequest, context: ExecutionContext
+    ) -> tuple[JsonRpcResponse | JsonRpcErrorResponse, ExecutionContext]:
+        """Handle initialize method: report server capabilities."""
+        return make_success_response(request.id, _INITIALIZE_RESULT_DUMP), context
+
+    async def _handle_tools_list(
+        self, request: JsonRpcRequest, context: ExecutionContext
+    ) -> tuple[JsonRpcResponse | JsonRpcErrorResponse, ExecutionContext]:
+        """Handle tools/list method: enumerate the frozen registry."""
+        return make_success_response(request.id, self._tools_list_dump), context
+
+    async def _handle_unknown_method(
+        self, request: JsonRpcRequest, context: ExecutionContext
+    ) -> tuple[JsonRpcResponse | JsonRpcErrorResponse, ExecutionContext]:
+        """Fallback for methods outside the routing table."""
+        response = make_error_response(
+            request.id,
+            ErrorCode.METHOD_NOT_FOUND,
+            f"Unknown method: {request.method}",
+        )
+        return response, context
+
     async def _handle_tools_call(
         self, request: JsonRpcRequest, context: ExecutionContext
     ) -> tuple[JsonRpcResponse | JsonRpcErrorResponse, ExecutionContext]:
@@ -338,60 +561,75 @@ class RestToMcpAdapter:
             )
             return response, context
 
-        try:
-            params = ToolCallParams(**request.params)
-        except PydanticValidationError as e:
-            # ContractViolation: Request params do not match expected schema
-            response = make_error_response(
-                request.id,
-                ErrorCode.INVALID_PARAMS,
-                f"Invalid params: {e}",
-            )
-            return response, context
+        # FAST PATH: Well-formed params already satisfy ToolCallParams exactly
+        # (only known fields, str name, dict of str keys), so skip building the
+        # model. Anything else goes through ToolCallParams, which stays the
+        # authority on what is accepted and how rejections are reported.
+        raw_params = request.params
+        name = raw_params.get("name")
+        arguments = raw_params.get("arguments", {})
+        if not (
+            type(name) is str
+            and type(arguments) is dict
+            and raw_params.keys() <= _TOOL_CALL_PARAM_FIELDS
+            and all(type(key) is str for key in arguments)
+        ):
+            try:
+                params = ToolCallParams(**raw_params)
+            except PydanticValidationError as e:
+                # ContractViolation: Request params do not match expected schema
+                response = make_error_response(
+                    request.id,
+                    ErrorCode.INVALID_PARAMS,
+                    f"Invalid params: {e}",
+                )
+                return response, context
+            name, arguments = params.name, params.arguments
 
         # Update context with tool call information (immutable)
-        context = context.with_tool_call(params.name, params.arguments)
+        context = context.with_tool_call(name, arguments)
 
         # ---------------------------------------------------------------------
         # ORCHESTRATION POLICY: Validate before invoking tool
         # ---------------------------------------------------------------------
-        if params.name not in self.endpoints:
+        endpoint = self._endpoints.get(name)
+        if endpoint is None:
             response = make_error_response(
                 request.id,
                 ErrorCode.INVALID_PARAMS,
-                f"Unknown tool: {params.name}",
+                f"Unknown tool: {name}",
             )
             return response, context
 
-        endpoint = self.endpoints[params.name]
-        validation_errors = endpoint.validate_arguments(params.arguments)
+        validation_errors = endpoint.validate_arguments(arguments)
         if validation_errors:
             response = make_error_response(
                 request.id,
                 ErrorCode.INVALID_PARAMS,
-                f"Tool '{params.name}' validation failed: {'; '.join(validation_errors)}",
-                data={"tool": params.name, "errors": validation_errors},
+                f"Tool '{name}' validation failed: {'; '.join(validation_errors)}",
+                data={"tool": name, "errors": validation_errors},
             )
             return response, context
 
         # ---------------------------------------------------------------------
         # ORCHESTRATION POLICY: Guard destructive operations
         # ---------------------------------------------------------------------
-        guard_error = self._check_destructive_operation(params.name, params.arguments)
-        if guard_error:
-            response = make_error_response(
-                request.id,
-                ErrorCode.INVALID_PARAMS,
-                guard_error,
-                data={"tool": params.name},
-            )
-            return response, context
+        for guard in self._guards.get(name, ()):
+            guard_error = guard(arguments)
+            if guard_error:
+                response = make_error_response(
+                    request.id,
+                    ErrorCode.INVALID_PARAMS,
+                    guard_error,
+                    data={"tool": name},
+                )
+                return response, context
 
         # ---------------------------------------------------------------------
         # Execute the tool (tool is dumb - just executes)
         # ---------------------------------------------------------------------
         try:
-            call_result = await self._call_tool(params.name, params.arguments)
+            call_result = await self._call_tool(name, arguments)
         except ToolTimeoutError as e:
             # DELIBERATE FAILURE: Timeout is handled explicitly
             # Context records the failure attempt (no result, but tool was called)
@@ -410,46 +648,34 @@ class RestToMcpAdapter:
         # CONTEXT GROWTH: Result is appended to context here.
         context = context.with_result(call_result)
 
-        response = make_success_response(request.id, call_result.model_dump())
+        response = make_success_response(request.id, _dump_tool_call_result(call_result))
         return response, context
 
-    def _check_destructive_operation(
-        self, name: str, arguments: dict[str, Any]
-    ) -> str | None:
-        """
-        Check if a destructive operation should be blocked.
-
-        Returns error message if blocked, None if allowed.
-
-        This is ORCHESTRATION policy, not tool logic.
-        The tool doesn't know it's being guarded.
-        """
-        if name in ("delete_post", "update_post"):
-            id_value = arguments.get("id", "")
-            try:
-                id_int = int(id_value)
-                if id_int <= 0:
-                    return (
-                        f"Destructive operation rejected: id={id_value} is not valid. "
-                        "Post IDs must be positive integers."
-                    )
-            except (ValueError, TypeError):
-                return (
-                    f"Destructive operation rejected: id={id_value!r} is not a valid integer."
-                )
-        return None
-
 
 # -----------------------------------------------------------------------------
 # Factory Functions
 # -----------------------------------------------------------------------------
 
 
+# JSONPlaceholder data is static, so its read tools are safe to cache.
+JSONPLACEHOLDER_CACHE_CONFIG = RestCacheConfig(
+    allowlist=frozenset({"get_posts", "get_post", "get_comments", "get_users", "get_user"}),
+)
+
+# Weather changes, but not within a minute: a short TTL absorbs an agent
+# repeating the same lookup without serving stale conditions for long.
+MULTI_API_CACHE_CONFIG = RestCacheConfig(
+    allowlist=JSONPLACEHOLDER_CACHE_CONFIG.allowlist,
+    tool_ttls={"get_weather": 60.0, "get_forecast": 60.0},
+)
+
+
 def create_jsonplaceholder_adapter() -> RestToMcpAdapter:
     """Create an adapter pre-configured for JSONPlaceholder API."""
     return RestToMcpAdapter(
         base_url=JSONPLACEHOLDER_BASE_URL,
         endpoints=JSONPLACEHOLDER_ENDPOINTS,
+        cache_config=JSONPLACEHOLDER_CACHE_CONFIG,
     )
 
 
@@ -463,4 +689,5 @@ def create_multi_api_adapter() -> RestToMcpAdapter:
     return RestToMcpAdapter(
         base_url=JSONPLACEHOLDER_BASE_URL,  # Default for relative paths
         endpoints=DEFAULT_ENDPOINTS,
+        cache_config=MULTI_API_CACHE_CONFIG,
     )
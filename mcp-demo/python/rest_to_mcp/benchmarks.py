@@ -10,8 +10,9 @@ Methodology:
 from __future__ import annotations
 
 import json
-import statistics
+import math
 import time
+from collections.abc import Generator
 from dataclasses import dataclass, asdict
 from typing import Any
 
@@ -52,6 +53,11 @@ PAYLOADS: dict[str, str] = {
     ),
 }
 
+# UTF-8 encoding of each payload, computed once at import
+PAYLOAD_BYTES: dict[str, bytes] = {
+    name: payload.encode("utf-8") for name, payload in PAYLOADS.items()
+}
+
 
 @dataclass
 class BenchmarkResult:
@@ -77,9 +83,21 @@ class BenchmarkResult:
 def _compute_stats(
     parser: str, payload_name: str, payload_bytes: int, iterations: int, timings: list[int]
 ) -> BenchmarkResult:
-    """Compute statistics from timing data."""
+    """
+    Compute statistics from timing data.
+
+    Plain float arithmetic: the statistics module does exact rational
+    arithmetic on int data, which is far slower and buys no useful
+    precision for nanosecond timings.
+    """
+    n = len(timings)
     sorted_timings = sorted(timings)
-    mean_ns = statistics.mean(timings)
+    mean_ns = sum(timings) / n
+    std_ns = (
+        math.sqrt(math.fsum((t - mean_ns) ** 2 for t in timings) / (n - 1))
+        if n > 1
+        else 0
+    )
 
     return BenchmarkResult(
         parser=parser,
@@ -87,7 +105,7 @@ def _compute_stats(
         payload_bytes=payload_bytes,
         iterations=iterations,
         mean_ns=mean_ns,
-        std_ns=statistics.stdev(timings) if len(timings) > 1 else 0,
+        std_ns=std_ns,
         min_ns=sorted_timings[0],
         max_ns=sorted_timings[-1],
         p50_ns=sorted_timings[int(len(timings) * 0.50)],
@@ -97,40 +115,143 @@ def _compute_stats(
     )
 
 
-def benchmark_python(
-    payload: str, payload_name: str, iterations: int = 10000, warmup: int = 100
-) -> BenchmarkResult:
+# Timed iterations between progress reports from the *_stream benchmarks
+BENCHMARK_STREAM_CHUNK = 1000
+
+# Progress reports yielded by the *_stream benchmarks; the generator's
+# return value is the final BenchmarkResult
+BenchmarkStream = Generator[dict[str, Any], None, BenchmarkResult]
+
+
+def _progress(ops: int, total_ns: int) -> dict[str, Any]:
+    """Running stats after ops timed iterations totalling total_ns."""
+    return {
+        "ops": ops,
+        "elapsed_ms": total_ns / 1_000_000,
+        "ops_per_sec_running": ops * 1_000_000_000 / total_ns if total_ns > 0 else 0,
+    }
+
+
+def _drain(stream: BenchmarkStream) -> BenchmarkResult:
+    """Run a benchmark stream to completion and return its result."""
+    while True:
+        try:
+            next(stream)
+        except StopIteration as stop:
+            result: BenchmarkResult = stop.value
+            return result
+
+
+def benchmark_python_stream(
+    payload: str,
+    payload_name: str,
+    iterations: int = 10000,
+    warmup: int = 100,
+    chunk: int = BENCHMARK_STREAM_CHUNK,
+) -> BenchmarkStream:
     """
     Benchmark Python json.loads + Pydantic validation.
 
-    This is what the current adapter uses for JSON-RPC parsing.
+    The two-pass baseline: stdlib decode to a dict, then model construction.
+    Yields running stats every chunk iterations.
     """
     payload_bytes = len(payload.encode("utf-8"))
+    # Bind once so the timed loop measures parsing, not attribute lookups
+    loads = json.loads
+    model = JsonRpcRequest
+    clock = time.perf_counter_ns
 
     # Warm-up phase
     for _ in range(warmup):
-        data = json.loads(payload)
-        _ = JsonRpcRequest(**data)
-
-    # Timed iterations
-    timings: list[int] = []
-    for _ in range(iterations):
-        start = time.perf_counter_ns()
-        data = json.loads(payload)
-        _ = JsonRpcRequest(**data)
-        end = time.perf_counter_ns()
-        timings.append(end - start)
+        data = loads(payload)
+        _ = model(**data)
+
+    # Timed iterations, in chunks
+    timings: list[int] = [0] * iterations
+    total_ns = 0
+    for lo in range(0, iterations, chunk):
+        hi = min(lo + chunk, iterations)
+        for i in range(lo, hi):
+            start = clock()
+            data = loads(payload)
+            _ = model(**data)
+            end = clock()
+            timings[i] = end - start
+        total_ns += sum(timings[lo:hi])
+        yield _progress(hi, total_ns)
 
     return _compute_stats("python", payload_name, payload_bytes, iterations, timings)
 
 
-def benchmark_rust(
+def benchmark_python(
     payload: str, payload_name: str, iterations: int = 10000, warmup: int = 100
 ) -> BenchmarkResult:
+    """Benchmark Python json.loads + Pydantic validation in one call."""
+    return _drain(benchmark_python_stream(payload, payload_name, iterations, warmup))
+
+
+def benchmark_python_validate_json_stream(
+    payload: str,
+    payload_name: str,
+    iterations: int = 10000,
+    warmup: int = 100,
+    chunk: int = BENCHMARK_STREAM_CHUNK,
+) -> BenchmarkStream:
+    """
+    Benchmark Pydantic model_validate_json on the raw bytes.
+
+    This is what server.mcp_endpoint uses: pydantic-core parses the JSON
+    itself, so no intermediate dict is materialized. Yields running stats
+    every chunk iterations.
+    """
+    raw = payload.encode("utf-8")
+    payload_bytes = len(raw)
+    validate_json = JsonRpcRequest.model_validate_json
+    clock = time.perf_counter_ns
+
+    # Warm-up phase
+    for _ in range(warmup):
+        _ = validate_json(raw)
+
+    # Timed iterations, in chunks
+    timings: list[int] = [0] * iterations
+    total_ns = 0
+    for lo in range(0, iterations, chunk):
+        hi = min(lo + chunk, iterations)
+        for i in range(lo, hi):
+            start = clock()
+            _ = validate_json(raw)
+            end = clock()
+            timings[i] = end - start
+        total_ns += sum(timings[lo:hi])
+        yield _progress(hi, total_ns)
+
+    return _compute_stats(
+        "python_validate_json", payload_name, payload_bytes, iterations, timings
+    )
+
+
+def benchmark_python_validate_json(
+    payload: str, payload_name: str, iterations: int = 10000, warmup: int = 100
+) -> BenchmarkResult:
+    """Benchmark Pydantic model_validate_json in one call."""
+    return _drain(
+        benchmark_python_validate_json_stream(payload, payload_name, iterations, warmup)
+    )
+
+
+def benchmark_rust_stream(
+    payload: str,
+    payload_name: str,
+    iterations: int = 10000,
+    warmup: int = 100,
+    chunk: int = BENCHMARK_STREAM_CHUNK,
+) -> BenchmarkStream:
     """
     Benchmark Rust mcp_parser.parse_request().
 
     Uses serde_json + custom validation, called via PyO3 bindings.
+    Yields running stats every chunk iterations.
     """
     if not RUST_AVAILABLE:
         raise RuntimeError(
@@ -139,22 +260,36 @@ def benchmark_rust(
         )
 
     payload_bytes = len(payload.encode("utf-8"))
+    parse_request = mcp_parser.parse_request
+    clock = time.perf_counter_ns
 
     # Warm-up phase
     for _ in range(warmup):
-        _ = mcp_parser.parse_request(payload)
-
-    # Timed iterations
-    timings: list[int] = []
-    for _ in range(iterations):
-        start = time.perf_counter_ns()
-        _ = mcp_parser.parse_request(payload)
-        end = time.perf_counter_ns()
-        timings.append(end - start)
+        _ = parse_request(payload)
+
+    # Timed iterations, in chunks
+    timings: list[int] = [0] * iterations
+    total_ns = 0
+    for lo in range(0, iterations, chunk):
+        hi = min(lo + chunk, iterations)
+        for i in range(lo, hi):
+            start = clock()
+            _ = parse_request(payload)
+            end = clock()
+            timings[i] = end - start
+        total_ns += sum(timings[lo:hi])
+        yield _progress(hi, total_ns)
 
     return _compute_stats("rust", payload_name, payload_bytes, iterations, timings)
 
 
+def benchmark_rust(
+    payload: str, payload_name: str, iterations: int = 10000, warmup: int = 100
+) -> BenchmarkResult:
+    """Benchmark Rust mcp_parser.parse_request() in one call."""
+    return _drain(benchmark_rust_stream(payload, payload_name, iterations, warmup))
+
+
 async def run_benchmark(
     payload_name: str = "simple", iterations: int = 10000
 ) -> dict[str, Any]:
@@ -163,6 +298,7 @@ async def run_benchmark(
 
     Returns dict with:
     - python: BenchmarkResult
+    - python_validate_json: BenchmarkResult
     - rust: BenchmarkResult or None
     - rust_available: bool
     - speedup: float or None
@@ -171,9 +307,11 @@ async def run_benchmark(
 
     # Always run Python benchmark
     python_result = benchmark_python(payload, payload_name, iterations)
+    validate_json_result = benchmark_python_validate_json(payload, payload_name, iterations)
 
     result: dict[str, Any] = {
         "python": python_result.to_dict(),
+        "python_validate_json": validate_json_result.to_dict(),
         "rust": None,
         "rust_available": RUST_AVAILABLE,
         "speedup": None,
@@ -192,6 +330,6 @@ async def run_benchmark(
 def get_payload_info() -> list[dict[str, Any]]:
     """Get information about available test payloads."""
     return [
-        {"name": name, "bytes": len(payload.encode("utf-8")), "preview": payload[:50] + "..."}
+        {"name": name, "bytes": len(PAYLOAD_BYTES[name]), "preview": payload[:50] + "..."}
         for name, payload in PAYLOADS.items()
     ]
@@ -0,0 +1,111 @@
+"""
+Response Cache
+
+Bounded LRU + TTL cache for read-only tool calls.
+
+Only successful responses from allowlisted GET tools are stored. Entries hold
+the already-rendered content blocks, so a hit skips the HTTP round-trip and
+the JSON decode/re-encode in _response_to_content.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+from .config import RESPONSE_CACHE_MAX_ENTRIES, RESPONSE_CACHE_TTL_SECONDS
+from .models import ContentBlock
+
+# (tool name, canonical JSON of the arguments)
+CallKey = tuple[str, bytes]
+
+
+@dataclass(frozen=True)
+class RestCacheConfig:
+    """
+    Cache policy for an adapter.
+
+    Caching is OPT-IN per tool: a tool is only cached if its name is in
+    the allowlist or has its own TTL in tool_ttls. Tools whose upstream data
+    changes quickly should stay out, or get a TTL short enough to tolerate.
+    """
+
+    enabled: bool = True
+    max_entries: int = RESPONSE_CACHE_MAX_ENTRIES
+    ttl_seconds: float = RESPONSE_CACHE_TTL_SECONDS
+    allowlist: frozenset[str] = field(default_factory=frozenset)
+    tool_ttls: Mapping[str, float] = field(default_factory=dict)
+
+    def ttl_for(self, tool_name: str) -> float:
+        """TTL for one tool: its own override, else the default."""
+        return self.tool_ttls.get(tool_name, self.ttl_seconds)
+
+
+class ResponseCache:
+    """
+    LRU + TTL store of tool results, keyed by (tool name, canonical arguments).
+
+    Entries carry their own expiry time, so tools with different TTLs can
+    share one LRU order.
+
+    No lock: get/put never await, so under asyncio they cannot interleave
+    with another coroutine. Not safe to share across threads.
+
+    generation counts clear() calls. A caller that reads it before an
+    upstream call and passes it to put() cannot store a result that was
+    fetched before a later clear().
+    """
+
+    def __init__(self, config: RestCacheConfig) -> None:
+        self.config = config
+        self.generation = 0
+        self._entries: OrderedDict[CallKey, tuple[float, tuple[ContentBlock, ...]]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def accepts(self, tool_name: str) -> bool:
+        """Whether results of this tool may be cached."""
+        config = self.config
+        return config.enabled and (
+            tool_name in config.allowlist or tool_name in config.tool_ttls
+        )
+
+    def get(self, key: CallKey) -> tuple[ContentBlock, ...] | None:
+        """Return cached content for key, or None if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, content = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return content
+
+    def put(
+        self, key: CallKey, content: list[ContentBlock], generation: int | None = None
+    ) -> None:
+        """
+        Store content for key, evicting least-recently-used entries.
+
+        If generation is given and the cache has been cleared since, the
+        content is stale and is dropped instead.
+        """
+        if generation is not None and generation != self.generation:
+            return
+        expires_at = time.monotonic() + self.config.ttl_for(key[0])
+        self._entries[key] = (expires_at, tuple(content))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.config.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.generation += 1
@@ -30,6 +30,23 @@ OPEN_METEO_BASE_URL = os.environ.get(
 HTTP_ERROR_THRESHOLD = 400
 HTTP_TIMEOUT_SECONDS = 30.0
 
+# Connection pool sizing for the shared upstream client. Keep-alive connections
+# are reused across tool calls so repeat calls skip the TCP/TLS handshake.
+HTTP_MAX_CONNECTIONS = 200
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 100
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 30.0
+
+# Upper bound on concurrently handled requests from a single JSON-RPC batch
+TOOL_BATCH_CONCURRENCY = 20
+
+# -----------------------------------------------------------------------------
+# Response Cache
+# Read-only upstream responses are cached in-process (see cache.py).
+# -----------------------------------------------------------------------------
+
+RESPONSE_CACHE_MAX_ENTRIES = 10_000
+RESPONSE_CACHE_TTL_SECONDS = 300.0
+
 # -----------------------------------------------------------------------------
 # WMO Weather Codes
 # Reference: https://open-meteo.com/en/docs
@@ -67,8 +84,19 @@ WMO_WEATHER_CODES: dict[int, str] = {
 }
 
 
+# Dense code -> description table (None for unassigned codes), so the common
+# case is a bounds check and an index instead of a hash lookup
+_WMO_TABLE: tuple[str | None, ...] = tuple(
+    WMO_WEATHER_CODES.get(code) for code in range(max(WMO_WEATHER_CODES) + 1)
+)
+
+
 def get_weather_description(code: int) -> str:
     """Get human-readable weather description from WMO code."""
+    if type(code) is int and 0 <= code < len(_WMO_TABLE):
+        description = _WMO_TABLE[code]
+        return description if description is not None else f"Weather code {code}"
+    # Out-of-range ints and non-int keys keep plain dict semantics
     return WMO_WEATHER_CODES.get(code, f"Weather code {code}")
 
 
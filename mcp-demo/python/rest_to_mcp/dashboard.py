@@ -14,14 +14,14 @@ In production, you'd likely disable this entirely or put it behind auth.
 from __future__ import annotations
 
 import asyncio
-import json
+import contextlib
 import os
 import sys
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from starlette.requests import Request
@@ -29,13 +29,19 @@ from starlette.requests import Request
 from .benchmarks import (
     PAYLOADS,
     RUST_AVAILABLE,
-    benchmark_python,
-    benchmark_rust,
+    BenchmarkResult,
+    BenchmarkStream,
+    benchmark_python_stream,
+    benchmark_python_validate_json_stream,
+    benchmark_rust_stream,
     get_payload_info,
 )
+from .json_codec import JSONDecodeError, dumps, loads
 from .playground import (
     EXAMPLE_QUERIES,
+    ScenarioStep,
     match_scenario,
+    plan_waves,
     substitute_args,
     build_summary,
 )
@@ -48,17 +54,92 @@ BASE_DIR = Path(__file__).parent
 STATIC_DIR = BASE_DIR / "static"
 TEMPLATES_DIR = BASE_DIR / "templates"
 
+# Max bytes of pytest output read per event-loop wakeup. Everything already
+# buffered is forwarded as one WebSocket message instead of one per line.
+TEST_OUTPUT_READ_BYTES = 65536
+
+# Pause between playground steps so the UI can animate each one in. Clients
+# may override it per query with "pace_ms" (0 = no pause), up to the max.
+PLAYGROUND_STEP_PACE_MS = 400
+PLAYGROUND_MAX_STEP_PACE_MS = 2000
+
 # Router for dashboard endpoints
 router = APIRouter()
 
+
+async def _send_json(websocket: WebSocket, message: dict[str, Any]) -> None:
+    """Send a JSON text frame, encoded with json_codec rather than stdlib json."""
+    await websocket.send_text(dumps(message))
+
+
+async def _receive_json(websocket: WebSocket) -> Any:
+    """Receive a JSON text frame, decoded with json_codec rather than stdlib json."""
+    return loads(await websocket.receive_text())
+
+
+class _EventBatch:
+    """
+    Collects WebSocket events and sends them together on flush().
+
+    One pending event goes out as-is; several go out as a single frame,
+    {"type": "batch", "events": [...]}, which the client unpacks in order.
+    """
+
+    def __init__(self, websocket: WebSocket) -> None:
+        self._websocket = websocket
+        self._pending: list[dict[str, Any]] = []
+
+    def add(self, message: dict[str, Any]) -> None:
+        self._pending.append(message)
+
+    async def flush(self) -> None:
+        pending, self._pending = self._pending, []
+        if len(pending) == 1:
+            await _send_json(self._websocket, pending[0])
+        elif pending:
+            await _send_json(self._websocket, {"type": "batch", "events": pending})
+
+
+def _advance(stream: BenchmarkStream) -> dict[str, Any] | BenchmarkResult:
+    """Step a benchmark stream: the next progress report, or the final result."""
+    try:
+        return next(stream)
+    except StopIteration as stop:
+        result: BenchmarkResult = stop.value
+        return result
+
+
+async def _run_benchmark_stream(
+    events: _EventBatch, parser: str, stream: BenchmarkStream
+) -> BenchmarkResult:
+    """
+    Drive a benchmark stream chunk by chunk in a worker thread.
+
+    Each chunk's running stats go out as a "progress_stats" event. Sending
+    to a closed socket raises, so a client that disconnects stops the
+    benchmark at the next chunk instead of after the last iteration.
+    """
+    while True:
+        item = await asyncio.to_thread(_advance, stream)
+        if isinstance(item, BenchmarkResult):
+            return item
+        events.add({"type": "progress_stats", "parser": parser, **item})
+        await events.flush()
+
+
 # Jinja2 templates
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
 
+# The dashboard page depends on no per-request context, so it is rendered
+# once here. If the template ever needs request data, go back to
+# templates.TemplateResponse in the route.
+_DASHBOARD_HTML = templates.get_template("dashboard.html").render()
+
 
 @router.get("/", response_class=HTMLResponse)
 async def dashboard(request: Request) -> HTMLResponse:
     """Serve the main dashboard page."""
-    return templates.TemplateResponse("dashboard.html", {"request": request})
+    return HTMLResponse(_DASHBOARD_HTML)
 
 
 @router.websocket("/ws/tests")
@@ -66,8 +147,10 @@ async def websocket_test_runner(websocket: WebSocket) -> None:
     """
     WebSocket endpoint for streaming test output.
 
-    Runs pytest and streams stdout/stderr line by line to the client.
+    Runs pytest and streams stdout/stderr to the client as it is produced.
     This gives real-time feedback rather than blocking until tests complete.
+    Each message carries whole lines: whatever output was available at the
+    time, so a burst of verbose output costs one frame, not one per line.
 
     Security note: In production, this would need authentication.
     Running arbitrary subprocess commands is dangerous - here we only run pytest.
@@ -78,6 +161,13 @@ async def websocket_test_runner(websocket: WebSocket) -> None:
     # Find the python directory (where tests live)
     python_dir = BASE_DIR.parent
 
+    # Raced against every read below, so a client close is seen at once
+    # rather than on the next failed send
+    recv_task = asyncio.create_task(websocket.receive())
+    read_task: asyncio.Task[bytes] | None = None
+    process: asyncio.subprocess.Process | None = None
+    disconnected = False
+
     try:
         # Run pytest with unbuffered output for real-time streaming
         # -v for verbose, --tb=short for concise tracebacks
@@ -91,22 +181,46 @@ async def websocket_test_runner(websocket: WebSocket) -> None:
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.STDOUT,
             env=env,
+            # Every fd Python opens is already non-inheritable (PEP 446), so
+            # the child-side close pass over the fd table buys nothing here
+            close_fds=False,
         )
 
-        # Stream output line by line
-        while True:
-            if process.stdout is None:
+        # Stream output in chunks of complete lines; a partial trailing line
+        # waits in `pending` for the rest of it
+        pending = b""
+        while process.stdout is not None:
+            if read_task is None:
+                read_task = asyncio.create_task(process.stdout.read(TEST_OUTPUT_READ_BYTES))
+
+            done, _ = await asyncio.wait(
+                {read_task, recv_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            if recv_task in done:
+                if recv_task.result()["type"] == "websocket.disconnect":
+                    # Client went away: pytest is reaped below, not when it finishes
+                    disconnected = True
+                    return
+                # Nothing is expected from the client on this socket
+                recv_task = asyncio.create_task(websocket.receive())
+
+            if read_task not in done:
+                continue
+
+            chunk = read_task.result()
+            read_task = None
+            if not chunk:
                 break
 
-            line = await process.stdout.readline()
-            if not line:
-                break
+            lines, newline, pending = (pending + chunk).rpartition(b"\n")
+            if not newline:
+                continue
 
-            try:
-                await websocket.send_text(line.decode("utf-8", errors="replace").rstrip())
-            except WebSocketDisconnect:
-                process.kill()
-                return
+            await websocket.send_text(lines.decode("utf-8", errors="replace").rstrip())
+
+        if pending:
+            await websocket.send_text(pending.decode("utf-8", errors="replace").rstrip())
 
         # Wait for process to complete
         await process.wait()
@@ -118,10 +232,25 @@ async def websocket_test_runner(websocket: WebSocket) -> None:
         else:
             await websocket.send_text(f"\n✗ Tests failed (exit code {exit_code})")
 
+    except WebSocketDisconnect:
+        # A send failed first: the client is gone just the same
+        disconnected = True
     except Exception as e:
         await websocket.send_text(f"Error running tests: {e}")
     finally:
-        await websocket.close()
+        # However we got here, never leave pytest running unattended
+        if process is not None and process.returncode is None:
+            with contextlib.suppress(ProcessLookupError):
+                process.kill()
+        pending_tasks = {t for t in (recv_task, read_task) if t is not None and not t.done()}
+        for task in pending_tasks:
+            task.cancel()
+        if pending_tasks:
+            await asyncio.wait(pending_tasks)
+        if process is not None:
+            await process.wait()
+        if not disconnected:
+            await websocket.close()
 
 
 @router.websocket("/ws/benchmarks")
@@ -131,50 +260,82 @@ async def websocket_benchmark_runner(websocket: WebSocket) -> None:
 
     Runs Python vs Rust parser benchmarks and streams progress/results.
     Client sends: {"payload": "simple"|"complex", "iterations": 1000-100000}
-    Server sends: {"type": "progress"|"result"|"complete"|"error", ...}
+    Server sends: {"type": "progress"|"progress_stats"|"result"|"complete"|"error", ...}
+
+    Each benchmark runs chunk by chunk in a worker thread so the event loop
+    keeps serving other connections meanwhile, and running stats stream out
+    as {"type": "progress_stats"} after every chunk. Events produced back to
+    back are sent as one {"type": "batch"} frame; the queue is flushed
+    before each run.
     """
     await websocket.accept()
+    events = _EventBatch(websocket)
 
     try:
         # Receive benchmark config
-        data = await websocket.receive_json()
+        data = await _receive_json(websocket)
         payload_name = data.get("payload", "simple")
         iterations = min(max(int(data.get("iterations", 10000)), 100), 100000)
 
         payload = PAYLOADS.get(payload_name, PAYLOADS["simple"])
 
         # Send initial status
-        await websocket.send_json({
+        events.add({
             "type": "status",
             "message": f"Running benchmarks with {iterations:,} iterations...",
             "rust_available": RUST_AVAILABLE,
         })
 
         # Run Python benchmark
-        await websocket.send_json({
+        events.add({
             "type": "progress",
             "parser": "python",
             "message": "Running Python benchmark (json.loads + Pydantic)...",
         })
 
-        python_result = benchmark_python(payload, payload_name, iterations)
+        await events.flush()
+        python_result = await _run_benchmark_stream(
+            events, "python", benchmark_python_stream(payload, payload_name, iterations)
+        )
 
-        await websocket.send_json({
+        events.add({
             "type": "result",
             "result": python_result.to_dict(),
         })
 
+        # Run the server's actual parse path (pydantic-core JSON parser)
+        events.add({
+            "type": "progress",
+            "parser": "python_validate_json",
+            "message": "Running Python benchmark (Pydantic model_validate_json)...",
+        })
+
+        await events.flush()
+        validate_json_result = await _run_benchmark_stream(
+            events,
+            "python_validate_json",
+            benchmark_python_validate_json_stream(payload, payload_name, iterations),
+        )
+
+        events.add({
+            "type": "result",
+            "result": validate_json_result.to_dict(),
+        })
+
         # Run Rust benchmark if available
         if RUST_AVAILABLE:
-            await websocket.send_json({
+            events.add({
                 "type": "progress",
                 "parser": "rust",
                 "message": "Running Rust benchmark (mcp_parser)...",
             })
 
-            rust_result = benchmark_rust(payload, payload_name, iterations)
+            await events.flush()
+            rust_result = await _run_benchmark_stream(
+                events, "rust", benchmark_rust_stream(payload, payload_name, iterations)
+            )
 
-            await websocket.send_json({
+            events.add({
                 "type": "result",
                 "result": rust_result.to_dict(),
             })
@@ -184,27 +345,30 @@ async def websocket_benchmark_runner(websocket: WebSocket) -> None:
             if python_result.ops_per_sec > 0:
                 speedup = round(rust_result.ops_per_sec / python_result.ops_per_sec, 2)
 
-            await websocket.send_json({
+            events.add({
                 "type": "complete",
                 "speedup": speedup,
                 "message": f"Rust is {speedup}x faster" if speedup else "Benchmark complete",
             })
         else:
-            await websocket.send_json({
+            events.add({
                 "type": "complete",
                 "speedup": None,
                 "message": "Rust parser not available. Install Rust and run: maturin develop --release",
                 "rust_install_hint": True,
             })
 
+        await events.flush()
+
     except WebSocketDisconnect:
         pass
     except Exception as e:
         try:
-            await websocket.send_json({
+            events.add({
                 "type": "error",
                 "message": str(e),
             })
+            await events.flush()
         except Exception:
             pass
     finally:
@@ -214,14 +378,18 @@ async def websocket_benchmark_runner(websocket: WebSocket) -> None:
             pass
 
 
+# Static for the process lifetime: encoded once, served as-is
+_BENCHMARK_INFO_JSON = dumps({
+    "payloads": get_payload_info(),
+    "rust_available": RUST_AVAILABLE,
+    "iterations_options": [1000, 10000, 100000],
+})
+
+
 @router.get("/api/benchmark-info")
-async def benchmark_info() -> dict:
+async def benchmark_info() -> Response:
     """Get information about available benchmarks."""
-    return {
-        "payloads": get_payload_info(),
-        "rust_available": RUST_AVAILABLE,
-        "iterations_options": [1000, 10000, 100000],
-    }
+    return Response(_BENCHMARK_INFO_JSON, media_type="application/json")
 
 
 # Store adapter reference for playground to use
@@ -234,24 +402,79 @@ def set_adapter(adapter: RestToMcpAdapter) -> None:
     _adapter = adapter
 
 
+async def _execute_playground_step(
+    adapter: RestToMcpAdapter, index: int, step: ScenarioStep, args: dict[str, Any]
+) -> tuple[int, Any, Any]:
+    """
+    Run one playground step. Returns (index, tool_result, parsed_data).
+
+    Failures are reported in tool_result rather than raised, so one failed
+    step never cancels the rest of its wave.
+    """
+    # TODO: EXECUTION AUTHORITY SPLIT (Issue 4)
+    # This module directly invokes adapter._call_tool(), bypassing the
+    # authoritative entry point (handle_request). This is intentional for
+    # demo purposes (simulating multi-step LLM orchestration) but violates
+    # the single request path principle.
+    #
+    # DECISION REQUIRED: Should playground scenarios route through handle_request
+    # with synthetic JSON-RPC requests, or is internal demo tooling exempt from
+    # the single path constraint?
+    #
+    # Current behavior: tools/list uses handle_request, but tools/call bypasses it.
+    # This inconsistency should be resolved architecturally.
+    #
+    parsed_data: Any = {}
+    try:
+        if step.tool == "__tools_list__":
+            # Use golden path for tools/list (proper MCP method)
+            from .models import JsonRpcRequest
+            request = JsonRpcRequest(id=1, method="tools/list", params={})
+            response, _ctx = await adapter.handle_request(request)
+            tool_result = response.result if hasattr(response, "result") else {}
+            parsed_data = tool_result
+        else:
+            # Direct tool call for simulation (bypasses handle_request)
+            call_result = await adapter._call_tool(step.tool, args)
+            tool_result = call_result.model_dump()
+
+            # Parse the JSON from content for cross-step data flow
+            if isinstance(tool_result, dict) and "content" in tool_result:
+                content_list = tool_result.get("content", [])
+                if content_list and isinstance(content_list[0], dict):
+                    text = content_list[0].get("text", "")
+                    try:
+                        parsed_data = loads(text)
+                    except (JSONDecodeError, TypeError):
+                        parsed_data = {}
+    except Exception as e:
+        tool_result = {"error": str(e)}
+
+    return index, tool_result, parsed_data
+
+
 @router.websocket("/ws/playground")
 async def websocket_playground(websocket: WebSocket) -> None:
     """
     WebSocket endpoint for agent playground.
 
     Executes multi-tool scenarios step-by-step with live streaming.
-    Client sends: {"input": "Get posts by user 1"}
+    Client sends: {"input": "Get posts by user 1", "pace_ms": 0-2000 (optional)}
     Server sends: scenario_matched, step_start, step_result, complete events
     """
     await websocket.accept()
 
     try:
         # Receive user input
-        data = await websocket.receive_json()
+        data = await _receive_json(websocket)
         user_input = data.get("input", "").strip()
+        pace_ms = min(
+            max(int(data.get("pace_ms", PLAYGROUND_STEP_PACE_MS)), 0),
+            PLAYGROUND_MAX_STEP_PACE_MS,
+        )
 
         if not user_input:
-            await websocket.send_json({
+            await _send_json(websocket, {
                 "type": "error",
                 "message": "Please enter a query.",
             })
@@ -261,14 +484,14 @@ async def websocket_playground(websocket: WebSocket) -> None:
         scenario, captures = match_scenario(user_input)
 
         if not scenario:
-            await websocket.send_json({
+            await _send_json(websocket, {
                 "type": "error",
                 "message": f"I don't understand that request. Try one of these:\n• {chr(10).join(EXAMPLE_QUERIES[:3])}",
             })
             return
 
         # Send scenario matched event
-        await websocket.send_json({
+        await _send_json(websocket, {
             "type": "scenario_matched",
             "name": scenario.description,
             "steps_count": len(scenario.steps),
@@ -276,86 +499,68 @@ async def websocket_playground(websocket: WebSocket) -> None:
 
         # Check adapter availability
         if _adapter is None:
-            await websocket.send_json({
+            await _send_json(websocket, {
                 "type": "error",
                 "message": "Adapter not initialized. Please restart the server.",
             })
             return
 
-        # Execute steps
+        # Execute steps wave by wave. Steps in one wave do not use each
+        # other's results, so their tool calls run concurrently; a step that
+        # needs an earlier result waits for the next wave.
         results: list[dict] = []
-
-        for i, step in enumerate(scenario.steps):
-            # Send step start
-            await websocket.send_json({
-                "type": "step_start",
-                "index": i,
-                "tool": step.tool,
-                "label": step.label,
-            })
-
-            # Build arguments from template (pass previous results for cross-step data flow)
-            args = substitute_args(step.args_template, captures, results)
-
-            # Execute the tool
-            #
-            # TODO: EXECUTION AUTHORITY SPLIT (Issue 4)
-            # This module directly invokes _adapter._call_tool(), bypassing the
-            # authoritative entry point (handle_request). This is intentional for
-            # demo purposes (simulating multi-step LLM orchestration) but violates
-            # the single request path principle.
-            #
-            # DECISION REQUIRED: Should playground scenarios route through handle_request
-            # with synthetic JSON-RPC requests, or is internal demo tooling exempt from
-            # the single path constraint?
-            #
-            # Current behavior: tools/list uses handle_request, but tools/call bypasses it.
-            # This inconsistency should be resolved architecturally.
-            #
-            parsed_data = {}
-            try:
-                if step.tool == "__tools_list__":
-                    # Use golden path for tools/list (proper MCP method)
-                    from .models import JsonRpcRequest
-                    request = JsonRpcRequest(id=1, method="tools/list", params={})
-                    response, _ctx = await _adapter.handle_request(request)
-                    tool_result = response.result if hasattr(response, "result") else {}
-                    parsed_data = tool_result
-                else:
-                    # Direct tool call for simulation (bypasses handle_request)
-                    tool_result = await _adapter._call_tool(step.tool, args)
-                    tool_result = tool_result.model_dump() if hasattr(tool_result, "model_dump") else tool_result
-
-                    # Parse the JSON from content for cross-step data flow
-                    if isinstance(tool_result, dict) and "content" in tool_result:
-                        content_list = tool_result.get("content", [])
-                        if content_list and isinstance(content_list[0], dict):
-                            text = content_list[0].get("text", "")
-                            try:
-                                parsed_data = json.loads(text)
-                            except (json.JSONDecodeError, TypeError):
-                                parsed_data = {}
-            except Exception as e:
-                tool_result = {"error": str(e)}
-
-            results.append({"tool": step.tool, "args": args, "result": tool_result, "parsed_data": parsed_data})
-
-            # Send step result
-            await websocket.send_json({
-                "type": "step_result",
-                "index": i,
-                "tool": step.tool,
-                "args": args,
-                "result": tool_result,
-            })
-
-            # Small delay for visual effect
-            await asyncio.sleep(0.4)
+        waves = plan_waves(scenario.steps)
+
+        for wave_number, wave in enumerate(waves):
+            wave_args: dict[int, dict[str, Any]] = {}
+            for i in wave:
+                step = scenario.steps[i]
+                await _send_json(websocket, {
+                    "type": "step_start",
+                    "index": i,
+                    "tool": step.tool,
+                    "label": step.label,
+                })
+                # Build arguments from template (pass previous results for cross-step data flow)
+                wave_args[i] = substitute_args(step.args_template, captures, results)
+
+            # Stream each result as soon as its call finishes
+            wave_results: dict[int, dict[str, Any]] = {}
+            for finished in asyncio.as_completed(
+                [
+                    _execute_playground_step(_adapter, i, scenario.steps[i], wave_args[i])
+                    for i in wave
+                ]
+            ):
+                i, tool_result, parsed_data = await finished
+                step = scenario.steps[i]
+                wave_results[i] = {
+                    "tool": step.tool,
+                    "args": wave_args[i],
+                    "result": tool_result,
+                    "parsed_data": parsed_data,
+                }
+
+                # Send step result
+                await _send_json(websocket, {
+                    "type": "step_result",
+                    "index": i,
+                    "tool": step.tool,
+                    "args": wave_args[i],
+                    "result": tool_result,
+                })
+
+            # $result.N indexes by step, so keep results in step order
+            results.extend(wave_results[i] for i in wave)
+
+            # Pause for visual effect, except after the last wave
+            if pace_ms and wave_number < len(waves) - 1:
+                await asyncio.sleep(pace_ms / 1000)
 
         # Build and send summary
         summary = build_summary(scenario, results)
 
-        await websocket.send_json({
+        await _send_json(websocket, {
             "type": "complete",
             "summary": summary,
         })
@@ -364,7 +569,7 @@ async def websocket_playground(websocket: WebSocket) -> None:
         pass
     except Exception as e:
         try:
-            await websocket.send_json({
+            await _send_json(websocket, {
                 "type": "error",
                 "message": str(e),
             })
@@ -377,10 +582,13 @@ async def websocket_playground(websocket: WebSocket) -> None:
             pass
 
 
+_PLAYGROUND_EXAMPLES_JSON = dumps({"examples": EXAMPLE_QUERIES})
+
+
 @router.get("/api/playground-examples")
-async def playground_examples() -> dict:
+async def playground_examples() -> Response:
     """Get example queries for the playground."""
-    return {"examples": EXAMPLE_QUERIES}
+    return Response(_PLAYGROUND_EXAMPLES_JSON, media_type="application/json")
 
 
 def get_static_files() -> StaticFiles:
@@ -12,10 +12,27 @@ To remove a domain: delete the file and remove the import.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+_PLACEHOLDER = re.compile(r"\{([^{}]+)\}")
+
+# Parameter kind bit flags. A name may be declared in more than one category.
+_PATH = 1
+_QUERY = 2
+_BODY = 4
+
+# Methods whose body params are required arguments
+_BODY_REQUIRED_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+# Validation message templates, formatted only when an argument is rejected
+_UNKNOWN_ARGUMENT = "Unknown argument '{}' - tool '{}' does not accept this parameter"
+_MISSING_PATH_PARAM = "Missing required path parameter: '{}'"
+_EMPTY_PATH_PARAM = "Path parameter '{}' cannot be empty"
+_MISSING_BODY_PARAM = "Missing required body parameter: '{}'"
+
 
 class HttpMethod(str, Enum):
     """HTTP methods supported by the adapter."""
@@ -27,11 +44,14 @@ class HttpMethod(str, Enum):
     PATCH = "PATCH"
 
 
-@dataclass
+@dataclass(frozen=True)
 class RestEndpoint:
     """
     Definition of a REST endpoint to expose as an MCP tool.
 
+    Frozen: derived data (path template, MCP tool schema) is computed once
+    at construction and must not drift from the fields it came from.
+
     This maps REST semantics to MCP tool semantics:
     - path: URL path (may contain {param} placeholders)
     - method: HTTP method
@@ -40,6 +60,7 @@ class RestEndpoint:
     - query_params: Parameters that go in the query string
     - body_params: Parameters that go in the request body
     - base_url: Optional API-specific base URL (enables multi-API support)
+    - pretty: Re-indent JSON responses (None = use the adapter's setting)
     """
 
     name: str
@@ -50,6 +71,90 @@ class RestEndpoint:
     query_params: list[str] | None = None
     body_params: list[str] | None = None
     base_url: str | None = None
+    pretty: bool | None = None
+
+    # Precompiled path template: literal chunks interleaved with path params.
+    # _path_literals always has one more entry than _path_slots.
+    _path_literals: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _path_slots: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _mcp_tool: Tool = field(init=False, repr=False, compare=False)
+    _param_kinds: dict[str, int] = field(init=False, repr=False, compare=False)
+    _method_str: str = field(init=False, repr=False, compare=False)
+    _absolute_base: str = field(init=False, repr=False, compare=False)
+    # Argument validation tables: every declared name, and the body params
+    # that must be present (empty unless the method is POST/PUT/PATCH)
+    _known_params: frozenset[str] = field(init=False, repr=False, compare=False)
+    _required_body: frozenset[str] = field(init=False, repr=False, compare=False)
+    # What validate_arguments({}) reports; zero-argument calls return a copy
+    _no_argument_errors: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        literals, slots = _compile_path(self.path, self.path_params or [])
+        object.__setattr__(self, "_path_literals", literals)
+        object.__setattr__(self, "_path_slots", slots)
+        # Plain str for the HTTP layer; Enum.value is a descriptor lookup
+        object.__setattr__(self, "_method_str", self.method.value)
+        object.__setattr__(self, "_mcp_tool", self._build_mcp_tool())
+        # "" when unset: the path stays relative to the adapter's base_url
+        object.__setattr__(self, "_absolute_base", (self.base_url or "").rstrip("/"))
+
+        kinds: dict[str, int] = {}
+        for params, kind in (
+            (self.path_params, _PATH),
+            (self.query_params, _QUERY),
+            (self.body_params, _BODY),
+        ):
+            for param in params or []:
+                kinds[param] = kinds.get(param, 0) | kind
+        object.__setattr__(self, "_param_kinds", kinds)
+        object.__setattr__(self, "_known_params", frozenset(kinds))
+        object.__setattr__(
+            self,
+            "_required_body",
+            frozenset(self.body_params or [])
+            if self._method_str in _BODY_REQUIRED_METHODS
+            else frozenset(),
+        )
+        object.__setattr__(self, "_no_argument_errors", tuple(self._collect_errors({})))
+
+    def partition_arguments(
+        self, arguments: dict[str, Any]
+    ) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+        """
+        Split arguments into (path, query, body) values in a single pass.
+
+        Undeclared arguments are dropped here; rejecting them is
+        validate_arguments' job. Missing arguments are the caller's to detect.
+        """
+        path: dict[str, Any] = {}
+        query: dict[str, Any] = {}
+        body: dict[str, Any] = {}
+        kinds = self._param_kinds
+        for name, value in arguments.items():
+            kind = kinds.get(name, 0)
+            if kind & _PATH:
+                path[name] = value
+            if kind & _QUERY:
+                query[name] = value
+            if kind & _BODY:
+                body[name] = value
+        return path, query, body
+
+    def render_path(self, arguments: dict[str, Any]) -> str:
+        """
+        Substitute path params into the precompiled template.
+
+        Caller must ensure every path param is present in arguments.
+        """
+        literals = self._path_literals
+        if not self._path_slots:
+            return literals[0]
+
+        parts = [literals[0]]
+        for param, literal in zip(self._path_slots, literals[1:], strict=True):
+            parts.append(str(arguments[param]))
+            parts.append(literal)
+        return "".join(parts)
 
     def validate_arguments(self, arguments: dict[str, Any]) -> list[str]:
         """
@@ -66,42 +171,49 @@ class RestEndpoint:
         This validation is intentionally strict. Tools should not receive
         data they did not ask for. Flexibility here is a liability.
         """
+        # Zero-argument calls (get_posts, get_users, ...) are the common case
+        # and always produce the same result, computed at construction
+        if not arguments:
+            return list(self._no_argument_errors)
+        return self._collect_errors(arguments)
+
+    def _collect_errors(self, arguments: dict[str, Any]) -> list[str]:
+        """The checks behind validate_arguments, without the empty fast path."""
         errors: list[str] = []
-
-        # Collect ALL known parameters for this endpoint
-        known_params: set[str] = set()
-        known_params.update(self.path_params or [])
-        known_params.update(self.query_params or [])
-        known_params.update(self.body_params or [])
+        keys = arguments.keys()
 
         # REJECT unknown arguments - tools receive ONLY what they declare
-        for arg in arguments:
-            if arg not in known_params:
-                errors.append(
-                    f"Unknown argument '{arg}' - tool '{self.name}' does not accept this parameter"
-                )
+        known_params = self._known_params
+        if not keys <= known_params:
+            for arg in arguments:
+                if arg not in known_params:
+                    errors.append(_UNKNOWN_ARGUMENT.format(arg, self.name))
 
         # Path params are ALWAYS required - you cannot have a URL with holes
         for param in self.path_params or []:
             if param not in arguments:
-                errors.append(f"Missing required path parameter: '{param}'")
+                errors.append(_MISSING_PATH_PARAM.format(param))
             else:
                 value = arguments[param]
                 # Path params must be non-empty strings (after conversion)
                 str_value = str(value).strip()
                 if not str_value:
-                    errors.append(f"Path parameter '{param}' cannot be empty")
+                    errors.append(_EMPTY_PATH_PARAM.format(param))
 
         # Body params are required for mutating methods
-        if self.method in (HttpMethod.POST, HttpMethod.PUT, HttpMethod.PATCH):
+        if not self._required_body <= keys:
             for param in self.body_params or []:
                 if param not in arguments:
-                    errors.append(f"Missing required body parameter: '{param}'")
+                    errors.append(_MISSING_BODY_PARAM.format(param))
 
         return errors
 
-    def to_mcp_tool(self) -> "Tool":
-        """Convert this REST endpoint definition to an MCP Tool."""
+    def to_mcp_tool(self) -> Tool:
+        """Return this REST endpoint definition as an MCP Tool."""
+        return self._mcp_tool
+
+    def _build_mcp_tool(self) -> Tool:
+        """Build the MCP Tool schema. Called once, at construction."""
         from .models import Tool, ToolInputSchema
 
         properties: dict[str, dict[str, Any]] = {}
@@ -128,7 +240,7 @@ class RestEndpoint:
                 "type": "string",
                 "description": f"Body field: {param}",
             }
-            if self.method in (HttpMethod.POST, HttpMethod.PUT, HttpMethod.PATCH):
+            if self._method_str in _BODY_REQUIRED_METHODS:
                 required.append(param)
 
         return Tool(
@@ -141,6 +253,33 @@ class RestEndpoint:
         )
 
 
+def _compile_path(
+    path: str, path_params: list[str]
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Split a path template into literal chunks and param slots.
+
+    Only declared path params become slots. Any other {placeholder} is
+    kept as literal text, matching plain string substitution.
+    """
+    declared = set(path_params)
+    literals: list[str] = []
+    slots: list[str] = []
+    current = ""
+    pos = 0
+    for match in _PLACEHOLDER.finditer(path):
+        current += path[pos:match.start()]
+        pos = match.end()
+        if match.group(1) in declared:
+            literals.append(current)
+            slots.append(match.group(1))
+            current = ""
+        else:
+            current += match.group(0)
+    literals.append(current + path[pos:])
+    return tuple(literals), tuple(slots)
+
+
 # Avoid circular import
 from .models import Tool  # noqa: E402
 
@@ -0,0 +1,72 @@
+"""
+Orchestration Guards
+
+Policy checks run by orchestration (_handle_tools_call) before a tool executes.
+
+Guards are ORCHESTRATION policy, not tool logic. Endpoints do not know they
+are guarded; the adapter looks guards up by tool name from a table resolved
+once at construction, so unguarded tools pay a single dict miss.
+
+A guard receives the validated arguments and returns an error message if the
+call must be blocked, or None to allow it.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+from typing import Any
+
+Guard = Callable[[dict[str, Any]], str | None]
+
+# Message templates, formatted only when a guard actually rejects
+_ID_NOT_POSITIVE = (
+    "Destructive operation rejected: id={} is not valid. "
+    "Post IDs must be positive integers."
+)
+_ID_NOT_INTEGER = "Destructive operation rejected: id={!r} is not a valid integer."
+
+
+def _parse_int(value: Any) -> int | None:
+    """
+    Parse an integer id without raising.
+
+    Accepts ints and decimal strings (optional sign, surrounding whitespace).
+    Everything else - bools, floats, malformed strings - is None. Checking
+    shape first means bad input never pays for exception construction.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if not isinstance(value, str):
+        return None
+
+    text = value.strip()
+    digits = text[1:] if text[:1] in ("+", "-") else text
+    if not digits.isdecimal():
+        return None
+    # int() refuses very long strings; treat those as malformed too
+    limit = sys.get_int_max_str_digits()
+    if limit and len(digits) > limit:
+        return None
+    return int(text)
+
+
+def positive_int_id(arguments: dict[str, Any]) -> str | None:
+    """Block destructive operations unless 'id' is a positive integer."""
+    id_value = arguments.get("id", "")
+    id_int = _parse_int(id_value)
+    if id_int is None:
+        return _ID_NOT_INTEGER.format(id_value)
+    if id_int <= 0:
+        return _ID_NOT_POSITIVE.format(id_value)
+    return None
+
+
+# Default policy: destructive JSONPlaceholder operations require a valid id
+DESTRUCTIVE_OPERATION_GUARDS: Mapping[str, tuple[Guard, ...]] = MappingProxyType({
+    "delete_post": (positive_int_id,),
+    "update_post": (positive_int_id,),
+})
@@ -0,0 +1,101 @@
+"""
+JSON codec helpers.
+
+Uses orjson (C, operates on raw UTF-8 bytes) when installed and degrades to
+the stdlib json module otherwise. Encoded output is identical either way, so
+callers never need to know which backend ran.
+
+One decode difference: orjson rounds integers wider than 64 bits to floats.
+That is harmless where values are only inspected, but text that is decoded
+and re-emitted must go through reindent(), which decodes exactly.
+
+Decode failures from both backends are json.JSONDecodeError instances
+(orjson.JSONDecodeError subclasses it), so callers catch that one type.
+
+STANDARD: Decode JSON through loads() here, never response.json() or a bare
+json.loads, so every path gets the fast backend.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+# Try to import orjson, gracefully degrade if not installed
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    ORJSON_AVAILABLE = False
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(data: Any) -> str:
+    """
+    Encode JSON compactly (no whitespace), as WebSocket.send_json would.
+
+    Values orjson cannot encode (e.g. integers beyond 64 bits, non-str keys)
+    fall back to the stdlib encoder.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data).decode()
+        except TypeError:
+            pass
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def dumps_pretty(data: Any) -> str:
+    """
+    Encode JSON with 2-space indentation.
+
+    Values orjson cannot encode (e.g. integers beyond 64 bits) fall back to
+    the stdlib encoder.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def reindent(data: bytes) -> str:
+    """
+    Re-encode JSON text with 2-space indentation, keeping every value exact.
+
+    Decodes with the stdlib: orjson would round integers wider than 64 bits
+    to floats. Invalid UTF-8 is reported as JSONDecodeError, as from loads().
+    """
+    try:
+        decoded = json.loads(data)
+    except UnicodeDecodeError as e:
+        raise JSONDecodeError(f"Invalid UTF-8: {e.reason}", "", e.start) from e
+    return dumps_pretty(decoded)
+
+
+def dumps_canonical(data: Any) -> bytes:
+    """
+    Encode JSON with sorted keys and no whitespace, for use as a lookup key.
+
+    Equal inputs always give equal bytes. Values orjson cannot encode (e.g.
+    integers beyond 64 bits) fall back to the stdlib encoder.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(
+        data, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode()
@@ -9,9 +9,11 @@ Reference: https://modelcontextprotocol.io/specification
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Literal, TypedDict
+from types import MappingProxyType
+from typing import Annotated, Any, Literal, TypedDict
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -199,7 +201,9 @@ class ImageContent(BaseModel):
     mimeType: str  # noqa: N815
 
 
-ContentBlock = TextContent | ImageContent
+# Tagged on "type": pydantic-core picks the variant from the tag in one
+# lookup instead of trying each member of the union in turn
+ContentBlock = Annotated[TextContent | ImageContent, Field(discriminator="type")]
 
 
 # -----------------------------------------------------------------------------
@@ -235,9 +239,11 @@ def make_error_response(
     data: Any | None = None,
 ) -> JsonRpcErrorResponse:
     """Construct a JSON-RPC error response."""
+    # ErrorCode is an int subclass and pydantic stores it as a plain int,
+    # so there is no need to pay for the Enum.value descriptor lookup
     return JsonRpcErrorResponse(
         id=request_id,
-        error=JsonRpcErrorData(code=code.value, message=message, data=data),
+        error=JsonRpcErrorData(code=code, message=message, data=data),
     )
 
 
@@ -250,6 +256,9 @@ def make_success_response(request_id: int | str, result: Any) -> JsonRpcResponse
 # Canonical Execution Context
 # -----------------------------------------------------------------------------
 
+# Shared by every context that has no tool call bound yet
+_NO_ARGUMENTS: Mapping[str, Any] = MappingProxyType({})
+
 
 class ContextError(ContractViolation):
     """Raised when context invariants are violated."""
@@ -344,8 +353,9 @@ class ExecutionContext:
         """
         Private constructor. Use from_request() instead.
 
-        The _trust_caller flag exists only for internal with_* methods
-        that have already validated the source context.
+        The _trust_caller flag exists only for from_request(), which has
+        already validated the request. The with_* methods skip __init__
+        entirely (see _derive()).
         """
         if not _trust_caller:
             raise ContextError(
@@ -356,7 +366,7 @@ class ExecutionContext:
         self._request_id = request_id
         self._method = method
         self._tool_name: str | None = None
-        self._arguments: dict[str, Any] = {}
+        self._arguments: Mapping[str, Any] = _NO_ARGUMENTS
         self._results: tuple[ToolCallResult, ...] = ()
         self._created_at = datetime.now(timezone.utc)
         self._sealed = False
@@ -402,9 +412,9 @@ class ExecutionContext:
         return self._tool_name
 
     @property
-    def arguments(self) -> dict[str, Any]:
-        # Return copy to prevent external mutation
-        return dict(self._arguments)
+    def arguments(self) -> Mapping[str, Any]:
+        # Read-only view: no per-access copy, and no way to mutate through it
+        return self._arguments
 
     @property
     def results(self) -> tuple[ToolCallResult, ...]:
@@ -450,13 +460,10 @@ class ExecutionContext:
         # Note: _sealed is intentionally not copied. The check above ensures
         # we never reach here from a sealed context. New contexts start unsealed
         # so they can be further mutated until explicitly sealed.
-        new_ctx = ExecutionContext(
-            self._request_id, self._method, _trust_caller=True
-        )
+        new_ctx = self._derive()
         new_ctx._tool_name = name.strip()
-        new_ctx._arguments = dict(arguments)  # defensive copy
-        new_ctx._results = self._results
-        new_ctx._created_at = self._created_at
+        # Defensive copy at the boundary; the view keeps it read-only after
+        new_ctx._arguments = MappingProxyType(dict(arguments))
         return new_ctx
 
     def with_result(self, result: ToolCallResult) -> "ExecutionContext":
@@ -486,13 +493,27 @@ class ExecutionContext:
 
         # Create new context (immutable pattern)
         # Note: _sealed intentionally not copied (see with_tool_call comment)
-        new_ctx = ExecutionContext(
-            self._request_id, self._method, _trust_caller=True
-        )
-        new_ctx._tool_name = self._tool_name
-        new_ctx._arguments = dict(self._arguments)
+        new_ctx = self._derive()
         new_ctx._results = self._results + (result,)
+        return new_ctx
+
+    def _derive(self) -> "ExecutionContext":
+        """
+        Unsealed copy of this context, for the with_* methods to modify.
+
+        Bypasses __init__: the source context was already validated, and its
+        creation timestamp is carried over rather than re-read from the clock.
+        The arguments are shared, not copied: they are held behind a read-only
+        MappingProxyType, so sharing is safe.
+        """
+        new_ctx = object.__new__(ExecutionContext)
+        new_ctx._request_id = self._request_id
+        new_ctx._method = self._method
+        new_ctx._tool_name = self._tool_name
+        new_ctx._arguments = self._arguments
+        new_ctx._results = self._results
         new_ctx._created_at = self._created_at
+        new_ctx._sealed = False
         return new_ctx
 
     # -------------------------------------------------------------------------
@@ -541,13 +562,8 @@ class ExecutionContext:
         """
         self._check_not_sealed("discard_results")
 
-        new_ctx = ExecutionContext(
-            self._request_id, self._method, _trust_caller=True
-        )
-        new_ctx._tool_name = self._tool_name
-        new_ctx._arguments = dict(self._arguments)
+        new_ctx = self._derive()
         new_ctx._results = ()  # DESTROYED. No configuration. No recovery.
-        new_ctx._created_at = self._created_at
         return new_ctx
 
     # -------------------------------------------------------------------------
@@ -8,12 +8,12 @@ Uses pattern matching to map natural language to predefined scenarios.
 
 from __future__ import annotations
 
-import json
 import re
 from dataclasses import dataclass
 from typing import Any
 
 from .config import JSONPLACEHOLDER_MAX_USER_ID, get_weather_description
+from .json_codec import JSONDecodeError, loads
 
 
 @dataclass
@@ -236,6 +236,41 @@ def substitute_args(
     return result
 
 
+def plan_waves(steps: list[ScenarioStep]) -> list[list[int]]:
+    """
+    Group step indexes into waves that can run concurrently.
+
+    A step joins the current wave unless its args reference ($result.N) a
+    step in that wave; then it starts a new one. Waves run in order, so every
+    referenced result is available before the step that needs it.
+
+    Example: [get_user, get_posts] -> [[0, 1]]
+             [get_user, get_weather($result.0...)] -> [[0], [1]]
+    """
+    waves: list[list[int]] = []
+    wave_start = 0
+    for i, step in enumerate(steps):
+        depends_on_current_wave = any(
+            wave_start <= idx < i for idx in _referenced_results(step.args_template)
+        )
+        if not waves or depends_on_current_wave:
+            waves.append([])
+            wave_start = i
+        waves[-1].append(i)
+    return waves
+
+
+def _referenced_results(args_template: dict[str, str]) -> set[int]:
+    """Indexes of previous results named by $result.N templates."""
+    referenced: set[int] = set()
+    for value in args_template.values():
+        if isinstance(value, str) and value.startswith("$result."):
+            index = value[8:].split(".", 1)[0]
+            if index.isdigit():
+                referenced.add(int(index))
+    return referenced
+
+
 def _substitute_single_value(
     value: str,
     captures: list[str],
@@ -326,8 +361,8 @@ def _parse_result_data(content: Any) -> Any:
         if content_list and isinstance(content_list[0], dict):
             text = content_list[0].get("text", "")
             try:
-                return json.loads(text)
-            except (json.JSONDecodeError, TypeError):
+                return loads(text)
+            except (JSONDecodeError, TypeError):
                 return {}
         return {}
 
@@ -14,19 +14,21 @@ All MCP clients MUST use POST /mcp with JSON-RPC 2.0 messages.
 Other endpoints (/health, /tools) exist for debugging only.
 """
 
-import json
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Any
 
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from pydantic import ValidationError
+from pydantic_core import from_json
 
 from .adapter import RestToMcpAdapter, create_multi_api_adapter
 from .dashboard import get_static_files, router as dashboard_router, set_adapter
+from .errors import GatewayFailure
 from .models import (
     ErrorCode,
+    ExecutionContext,
     JsonRpcErrorResponse,
     JsonRpcRequest,
     JsonRpcResponse,
@@ -71,45 +73,35 @@ app.include_router(dashboard_router)
 app.mount("/static", get_static_files(), name="static")
 
 
-@app.post("/mcp")
-async def mcp_endpoint(request: Request) -> JSONResponse:
+def _rpc_response(message: JsonRpcResponse | JsonRpcErrorResponse) -> Response:
     """
-    THE SINGLE ENTRY POINT for all MCP operations.
-
-    This is the golden path. All MCP clients send JSON-RPC 2.0 requests here.
-    The adapter routes to the appropriate handler and returns a sealed context.
+    Serialize a JSON-RPC message straight to bytes.
 
-    Supported methods:
-    - initialize: Handshake and capability discovery
-    - tools/list: Enumerate available tools
-    - tools/call: Execute a tool
+    model_dump_json encodes in pydantic-core, skipping the intermediate dict
+    and the stdlib json.dumps pass that JSONResponse would make.
     """
-    if adapter is None:
-        raise HTTPException(status_code=503, detail="Adapter not initialized")
-
-    # Parse raw JSON to handle malformed requests gracefully
-    try:
-        body = await request.json()
-    except json.JSONDecodeError:
-        # ContractViolation: Request body is not valid JSON
-        error = make_error_response(None, ErrorCode.PARSE_ERROR, "Invalid JSON")
-        return JSONResponse(content=error.model_dump(), status_code=200)
-
-    # Validate as JSON-RPC request
-    try:
-        rpc_request = JsonRpcRequest(**body)
-    except ValidationError as e:
-        # ContractViolation: Request does not conform to JSON-RPC schema
-        error = make_error_response(
-            body.get("id") if isinstance(body, dict) else None,
-            ErrorCode.INVALID_REQUEST,
-            f"Invalid request: {e}",
-        )
-        return JSONResponse(content=error.model_dump(), status_code=200)
-
-    # Handle the request (returns response + context for traceability)
-    response, _context = await adapter.handle_request(rpc_request)
-
+    return Response(
+        content=message.model_dump_json(),
+        status_code=200,
+        media_type="application/json",
+    )
+
+
+def _rpc_batch_response(
+    messages: list[JsonRpcResponse | JsonRpcErrorResponse],
+) -> Response:
+    """Serialize a JSON-RPC batch as a JSON array of already-encoded members."""
+    return Response(
+        content=b"[" + b",".join(m.model_dump_json().encode() for m in messages) + b"]",
+        status_code=200,
+        media_type="application/json",
+    )
+
+
+def _egress_checked(
+    request_id: str | int | None, response: object
+) -> JsonRpcResponse | JsonRpcErrorResponse:
+    """Return response if it is a JSON-RPC message, else an INTERNAL_ERROR in its place."""
     # -------------------------------------------------------------------------
     # MCP EGRESS VALIDATION: Defense-in-depth for response emission
     #
@@ -131,17 +123,134 @@ async def mcp_endpoint(request: Request) -> JSONResponse:
         # HARD FAIL: Unknown response type is a contract violation
         # This should never happen with current code paths, but we fail
         # loudly rather than emit potentially malformed MCP.
-        error = make_error_response(
-            rpc_request.id,
+        return make_error_response(
+            request_id,
             ErrorCode.INTERNAL_ERROR,
             f"MCP egress validation failed: response type {type(response).__name__} "
             "is not a valid JSON-RPC response type",
         )
-        return JSONResponse(content=error.model_dump(), status_code=200)
+    return response
+
+
+def _echoable_id(body: object) -> str | int | None:
+    """The id of an invalid request, if it is one an error response can carry."""
+    request_id = body.get("id") if isinstance(body, dict) else None
+    # bool is an int subclass, but not a valid JSON-RPC id
+    if isinstance(request_id, (str, int)) and not isinstance(request_id, bool):
+        return request_id
+    return None
+
 
-    response_dict = response.model_dump()
+async def _handle_batch_payload(gateway: RestToMcpAdapter, raw: bytes) -> Response:
+    """
+    Handle a JSON-RPC 2.0 batch (a JSON array of requests).
 
-    return JSONResponse(content=response_dict, status_code=200)
+    Each member is validated on its own; an invalid member gets its own
+    INVALID_REQUEST entry without failing its siblings. Valid members are
+    dispatched together through handle_batch, and a member whose handling
+    raises gets its own INTERNAL_ERROR entry. The response array keeps
+    request order.
+    """
+    # pydantic-core, like the single-request path: orjson would turn ids
+    # wider than 64 bits into floats
+    try:
+        body = from_json(raw)
+    except ValueError:
+        # ContractViolation: Request body is not valid JSON
+        return _rpc_response(make_error_response(None, ErrorCode.PARSE_ERROR, "Invalid JSON"))
+
+    if not body:
+        # ContractViolation: JSON-RPC 2.0 forbids an empty batch
+        return _rpc_response(
+            make_error_response(None, ErrorCode.INVALID_REQUEST, "Invalid request: empty batch")
+        )
+
+    messages: list[JsonRpcResponse | JsonRpcErrorResponse | None] = []
+    valid: list[JsonRpcRequest] = []
+    for item in body:
+        try:
+            valid.append(JsonRpcRequest.model_validate(item))
+            messages.append(None)
+        except ValidationError as e:
+            messages.append(
+                make_error_response(
+                    _echoable_id(item),
+                    ErrorCode.INVALID_REQUEST,
+                    f"Invalid request: {e}",
+                )
+            )
+
+    results = iter(await gateway.handle_batch(valid))
+    requests = iter(valid)
+    return _rpc_batch_response(
+        [
+            m if m is not None else _batch_member_response(next(requests).id, next(results))
+            for m in messages
+        ]
+    )
+
+
+def _batch_member_response(
+    request_id: str | int | None,
+    result: tuple[JsonRpcResponse | JsonRpcErrorResponse, ExecutionContext] | GatewayFailure,
+) -> JsonRpcResponse | JsonRpcErrorResponse:
+    """Response for one batch member; a failed member becomes INTERNAL_ERROR."""
+    if isinstance(result, GatewayFailure):
+        # Only this member failed: its siblings still get their responses
+        return make_error_response(
+            request_id,
+            ErrorCode.INTERNAL_ERROR,
+            f"Internal error: {result}",
+            data={"failure_category": result.failure_category},
+        )
+    return _egress_checked(request_id, result[0])
+
+
+@app.post("/mcp")
+async def mcp_endpoint(request: Request) -> Response:
+    """
+    THE SINGLE ENTRY POINT for all MCP operations.
+
+    This is the golden path. All MCP clients send JSON-RPC 2.0 requests here.
+    The adapter routes to the appropriate handler and returns a sealed context.
+
+    Supported methods:
+    - initialize: Handshake and capability discovery
+    - tools/list: Enumerate available tools
+    - tools/call: Execute a tool
+
+    A JSON array body is a JSON-RPC 2.0 batch and gets a JSON array back.
+    """
+    if adapter is None:
+        raise HTTPException(status_code=503, detail="Adapter not initialized")
+
+    # Parse and validate in one pass: pydantic-core decodes the raw bytes
+    # straight into the model, with no intermediate dict of Python objects.
+    raw = await request.body()
+    if raw.lstrip()[:1] == b"[":
+        return await _handle_batch_payload(adapter, raw)
+    try:
+        rpc_request = JsonRpcRequest.model_validate_json(raw)
+    except ValidationError as e:
+        if any(err["type"] == "json_invalid" for err in e.errors()):
+            # ContractViolation: Request body is not valid JSON
+            error = make_error_response(None, ErrorCode.PARSE_ERROR, "Invalid JSON")
+            return _rpc_response(error)
+
+        # ContractViolation: Request does not conform to JSON-RPC schema.
+        # Only this error path pays for a second decode, to echo the id. It
+        # uses the same parser that just accepted the body, so it cannot fail
+        # where orjson would (e.g. NaN), and wide integer ids stay exact.
+        error = make_error_response(
+            _echoable_id(from_json(raw)),
+            ErrorCode.INVALID_REQUEST,
+            f"Invalid request: {e}",
+        )
+        return _rpc_response(error)
+
+    # Handle the request (returns response + context for traceability)
+    response, _context = await adapter.handle_request(rpc_request)
+    return _rpc_response(_egress_checked(rpc_request.id, response))
 
 
 @app.get("/health")
@@ -159,4 +268,6 @@ async def health() -> dict[str, str]:
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # The only WebSockets are the dashboard's, carrying small JSON frames:
+    # per-message deflate costs more CPU than it saves on the wire.
+    uvicorn.run(app, host="0.0.0.0", port=8000, ws_per_message_deflate=False)
@@ -193,18 +193,19 @@ document.addEventListener('alpine:init', () => {
             };
 
             this.testSocket.onmessage = (event) => {
-                // Colorize output
-                let line = event.data;
-                if (line.includes('PASSED')) {
-                    line = `<span class="pass">${this.escapeHtml(line)}</span>`;
-                } else if (line.includes('FAILED')) {
-                    line = `<span class="fail">${this.escapeHtml(line)}</span>`;
-                } else if (line.includes('SKIPPED') || line.includes('skipped')) {
-                    line = `<span class="skip">${this.escapeHtml(line)}</span>`;
-                } else {
-                    line = this.escapeHtml(line);
+                // One message may carry several lines; colorize each
+                for (let line of event.data.split('\n')) {
+                    if (line.includes('PASSED')) {
+                        line = `<span class="pass">${this.escapeHtml(line)}</span>`;
+                    } else if (line.includes('FAILED')) {
+                        line = `<span class="fail">${this.escapeHtml(line)}</span>`;
+                    } else if (line.includes('SKIPPED') || line.includes('skipped')) {
+                        line = `<span class="skip">${this.escapeHtml(line)}</span>`;
+                    } else {
+                        line = this.escapeHtml(line);
+                    }
+                    this.testOutput += line + '\n';
                 }
-                this.testOutput += line + '\n';
 
                 // Auto-scroll
                 this.$nextTick(() => {
@@ -278,34 +279,43 @@ document.addEventListener('alpine:init', () => {
             };
 
             this.benchmarkSocket.onmessage = (event) => {
-                const data = JSON.parse(event.data);
-
-                switch (data.type) {
-                    case 'status':
-                        this.benchmarkStatus = data.message;
-                        this.rustAvailable = data.rust_available;
-                        break;
-
-                    case 'progress':
-                        this.benchmarkStatus = data.message;
-                        break;
-
-                    case 'result':
-                        this.benchmarkResults.push(data.result);
-                        break;
-
-                    case 'complete':
-                        this.benchmarkComplete = true;
-                        this.benchmarkRunning = false;
-                        this.benchmarkStatus = '';
-                        this.speedupFactor = data.speedup;
-                        this.$nextTick(() => this.renderBenchmarkCharts());
-                        break;
-
-                    case 'error':
-                        this.benchmarkStatus = `Error: ${data.message}`;
-                        this.benchmarkRunning = false;
-                        break;
+                const message = JSON.parse(event.data);
+                // Adjacent events may arrive together in one batch frame
+                const events = message.type === 'batch' ? message.events : [message];
+
+                for (const data of events) {
+                    switch (data.type) {
+                        case 'status':
+                            this.benchmarkStatus = data.message;
+                            this.rustAvailable = data.rust_available;
+                            break;
+
+                        case 'progress':
+                            this.benchmarkStatus = data.message;
+                            break;
+
+                        case 'progress_stats':
+                            this.benchmarkStatus = `${data.parser}: ${data.ops.toLocaleString()} ops, ` +
+                                `${Math.round(data.ops_per_sec_running).toLocaleString()} ops/sec`;
+                            break;
+
+                        case 'result':
+                            this.benchmarkResults.push(data.result);
+                            break;
+
+                        case 'complete':
+                            this.benchmarkComplete = true;
+                            this.benchmarkRunning = false;
+                            this.benchmarkStatus = '';
+                            this.speedupFactor = data.speedup;
+                            this.$nextTick(() => this.renderBenchmarkCharts());
+                            break;
+
+                        case 'error':
+                            this.benchmarkStatus = `Error: ${data.message}`;
+                            this.benchmarkRunning = false;
+                            break;
+                    }
                 }
             };
 
@@ -326,6 +336,7 @@ document.addEventListener('alpine:init', () => {
 
             const colors = {
                 python: '#f85149',
+                python_validate_json: '#d29922',
                 rust: '#3fb950'
             };
 
@@ -5,16 +5,29 @@ Tests the core translation logic without hitting external APIs.
 Uses httpx's mock transport for isolated testing.
 """
 
+import asyncio
+import dataclasses
 import json
+import time
 from typing import Any
 
 import httpx
 import pytest
 
 from rest_to_mcp.endpoints import HttpMethod, RestEndpoint
-from rest_to_mcp.adapter import RestToMcpAdapter, JSONPLACEHOLDER_ENDPOINTS
-from rest_to_mcp.errors import ContractViolation
-from rest_to_mcp.models import JsonRpcRequest, ToolValidationError
+from rest_to_mcp.adapter import RestToMcpAdapter, JSONPLACEHOLDER_ENDPOINTS, _dump_tool_call_result
+from rest_to_mcp.cache import ResponseCache, RestCacheConfig
+from rest_to_mcp.config import WMO_WEATHER_CODES, get_weather_description
+from rest_to_mcp.errors import ContractViolation, GatewayInternalFailure
+from rest_to_mcp.guards import positive_int_id
+from rest_to_mcp import json_codec
+from rest_to_mcp.models import (
+    ImageContent,
+    JsonRpcRequest,
+    TextContent,
+    ToolCallResult,
+    ToolValidationError,
+)
 
 
 # -----------------------------------------------------------------------------
@@ -105,6 +118,75 @@ class TestRestEndpoint:
         assert "name" in tool.inputSchema.required
         assert "value" in tool.inputSchema.required
 
+    def test_to_mcp_tool_is_built_once(self):
+        endpoint = RestEndpoint(
+            name="get_items",
+            path="/items",
+            method=HttpMethod.GET,
+            description="Get all items",
+        )
+        assert endpoint.to_mcp_tool() is endpoint.to_mcp_tool()
+
+    def test_endpoint_is_frozen(self):
+        """Derived schema cannot drift: fields are immutable after construction."""
+        endpoint = RestEndpoint(
+            name="get_items",
+            path="/items",
+            method=HttpMethod.GET,
+            description="Get all items",
+        )
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            endpoint.path = "/other"
+
+    def test_partition_arguments_single_pass(self):
+        endpoint = RestEndpoint(
+            name="update_item",
+            path="/items/{id}",
+            method=HttpMethod.PUT,
+            description="Update item",
+            path_params=["id"],
+            query_params=["dry_run"],
+            body_params=["name"],
+        )
+
+        path, query, body = endpoint.partition_arguments(
+            {"id": "1", "dry_run": "true", "name": "x", "unknown": "dropped"}
+        )
+
+        assert path == {"id": "1"}
+        assert query == {"dry_run": "true"}
+        assert body == {"name": "x"}
+
+    def test_render_path_static(self):
+        endpoint = RestEndpoint(
+            name="get_items",
+            path="/items",
+            method=HttpMethod.GET,
+            description="Get all items",
+        )
+        assert endpoint.render_path({}) == "/items"
+
+    def test_render_path_multiple_params(self):
+        endpoint = RestEndpoint(
+            name="get_comment",
+            path="/posts/{post_id}/comments/{id}",
+            method=HttpMethod.GET,
+            description="Get comment",
+            path_params=["post_id", "id"],
+        )
+        assert endpoint.render_path({"post_id": 3, "id": "7"}) == "/posts/3/comments/7"
+
+    def test_render_path_keeps_undeclared_placeholders(self):
+        """Only declared path params are substituted."""
+        endpoint = RestEndpoint(
+            name="get_item",
+            path="/items/{id}/{version}",
+            method=HttpMethod.GET,
+            description="Get item",
+            path_params=["id"],
+        )
+        assert endpoint.render_path({"id": "1", "version": "2"}) == "/items/1/{version}"
+
 
 # -----------------------------------------------------------------------------
 # Constrained Tool Invocation Tests (PR 4)
@@ -136,6 +218,25 @@ class TestRestEndpointValidation:
         assert "path parameter" in errors[0]
         assert "'id'" in errors[0]
 
+    def test_validate_no_arguments_returns_fresh_list(self):
+        """The precomputed zero-argument result cannot be mutated by callers."""
+        endpoint = RestEndpoint(
+            name="create_item",
+            path="/items/{id}",
+            method=HttpMethod.POST,
+            description="Create item",
+            path_params=["id"],
+            body_params=["name"],
+        )
+
+        errors = endpoint.validate_arguments({})
+        assert errors == [
+            "Missing required path parameter: 'id'",
+            "Missing required body parameter: 'name'",
+        ]
+        errors.clear()
+        assert len(endpoint.validate_arguments({})) == 2
+
     def test_validate_path_params_empty_string(self):
         """Empty path params must be rejected."""
         endpoint = RestEndpoint(
@@ -534,6 +635,50 @@ class TestDestructiveOperationGuards:
         assert "not a valid integer" in response.error.message
 
 
+    @pytest.mark.parametrize("id_value", ["5", " 7 ", "+3", 42])
+    def test_positive_int_id_accepts(self, id_value):
+        assert positive_int_id({"id": id_value}) is None
+
+    @pytest.mark.parametrize("id_value", [True, 1.5, "1e3", "\u00b2", "", None, [1]])
+    def test_positive_int_id_rejects_non_integers(self, id_value):
+        assert "not a valid integer" in positive_int_id({"id": id_value})
+
+    @pytest.mark.parametrize("id_value", ["0", "-5", -1])
+    def test_positive_int_id_rejects_non_positive(self, id_value):
+        assert "positive integers" in positive_int_id({"id": id_value})
+
+    @pytest.mark.asyncio
+    async def test_custom_guard_table(self):
+        """Guards are orchestration policy supplied per tool name."""
+        adapter = RestToMcpAdapter(
+            base_url="https://api.example.com",
+            endpoints=[
+                RestEndpoint(
+                    name="delete_item",
+                    path="/items/{id}",
+                    method=HttpMethod.DELETE,
+                    description="Delete an item",
+                    path_params=["id"],
+                ),
+            ],
+            guards={"delete_item": [lambda args: "blocked by policy"]},
+        )
+        request = JsonRpcRequest(
+            id=1,
+            method="tools/call",
+            params={"name": "delete_item", "arguments": {"id": "1"}},
+        )
+
+        response, _ = await adapter.handle_request(request)
+
+        assert response.error.message == "blocked by policy"
+        assert response.error.data["tool"] == "delete_item"
+
+    def test_guards_only_resolved_for_registered_tools(self, adapter_with_delete):
+        assert set(adapter_with_delete._guards) == {"delete_post", "update_post"}
+        assert RestToMcpAdapter(base_url="https://api.example.com")._guards == {}
+
+
 # -----------------------------------------------------------------------------
 # RestToMcpAdapter Tests
 # -----------------------------------------------------------------------------
@@ -594,6 +739,72 @@ class TestRestToMcpAdapter:
         assert "get_item" in names
         assert "create_item" in names
 
+    def test_list_tools_returns_fresh_list(self, mock_adapter):
+        """Tools are precomputed; callers get a copy they may mutate."""
+        adapter, _ = mock_adapter
+        adapter._list_tools().clear()
+
+        assert len(adapter._list_tools()) == 3
+
+    @pytest.mark.asyncio
+    async def test_handle_request_tools_list_matches_list_tools(self, mock_adapter):
+        adapter, _ = mock_adapter
+        request = JsonRpcRequest(id=1, method="tools/list")
+
+        response, _ = await adapter.handle_request(request)
+
+        expected = [tool.model_dump() for tool in adapter._list_tools()]
+        assert response.result["tools"] == expected
+
+    @pytest.mark.asyncio
+    async def test_client_uses_configured_pool(self, monkeypatch):
+        created: list[dict[str, Any]] = []
+        real_client = httpx.AsyncClient
+
+        def spy_client(**kwargs: Any) -> httpx.AsyncClient:
+            created.append(kwargs)
+            return real_client(**kwargs)
+
+        monkeypatch.setattr(httpx, "AsyncClient", spy_client)
+        limits = httpx.Limits(max_connections=5, max_keepalive_connections=2)
+        async with RestToMcpAdapter(
+            base_url="https://api.example.com", limits=limits, http2=False
+        ) as adapter:
+            client = adapter.client
+
+        assert isinstance(client, real_client)
+        assert created[0]["limits"] is limits
+        assert created[0]["http2"] is False
+
+    @pytest.mark.asyncio
+    async def test_client_accepts_compressed_responses(self):
+        """Pooled client advertises gzip."""
+        async with RestToMcpAdapter(base_url="https://api.example.com") as adapter:
+            encodings = adapter.client.headers["accept-encoding"]
+
+        assert "gzip" in encodings
+
+    @pytest.mark.asyncio
+    async def test_client_accepts_brotli_when_decoder_installed(self):
+        """Pooled client advertises brotli when a decoder is installed."""
+        pytest.importorskip("brotli")
+        async with RestToMcpAdapter(base_url="https://api.example.com") as adapter:
+            encodings = adapter.client.headers["accept-encoding"]
+
+        assert "br" in encodings
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager_closes_client(self, mock_adapter):
+        """Leaving the async context releases the pooled client."""
+        adapter, _ = mock_adapter
+
+        async with adapter as entered:
+            assert entered is adapter
+            await adapter._call_tool("get_items", {})
+            assert adapter._client is not None
+
+        assert adapter._client is None
+
     @pytest.mark.asyncio
     async def test_call_tool_success(self, mock_adapter):
         adapter, transport = mock_adapter
@@ -603,6 +814,122 @@ class TestRestToMcpAdapter:
         assert len(result.content) == 1
         assert "Item 1" in result.content[0].text
 
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_gets_share_one_request(self, mock_adapter):
+        """Single-flight: identical in-flight GET calls hit upstream once."""
+        adapter, transport = mock_adapter
+        original = transport.handle_async_request
+
+        async def slow_handle(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            return await original(request)
+
+        transport.handle_async_request = slow_handle
+
+        results = await asyncio.gather(
+            *(adapter._call_tool("get_item", {"id": "1"}) for _ in range(5))
+        )
+
+        assert len(transport.requests) == 1
+        assert all(r == results[0] for r in results)
+        assert adapter._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_single_flight_leader_does_not_fail_followers(
+        self, mock_adapter
+    ):
+        """Cancelling the call that started a shared GET only drops that call."""
+        adapter, transport = mock_adapter
+        original = transport.handle_async_request
+
+        async def slow_handle(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            return await original(request)
+
+        transport.handle_async_request = slow_handle
+
+        leader = asyncio.create_task(adapter._call_tool("get_item", {"id": "1"}))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(adapter._call_tool("get_item", {"id": "1"}))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        result = await follower
+
+        assert leader.cancelled()
+        assert "Item 1" in result.content[0].text
+        assert len(transport.requests) == 1
+        assert adapter._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_handle_batch_preserves_order_and_seals_each_context(
+        self, mock_adapter
+    ):
+        """Each batch member takes the full handle_request path."""
+        adapter, transport = mock_adapter
+
+        results = await adapter.handle_batch([
+            JsonRpcRequest(id=1, method="tools/call",
+                           params={"name": "get_item", "arguments": {"id": "1"}}),
+            JsonRpcRequest(id=2, method="tools/list"),
+            JsonRpcRequest(id=3, method="tools/call",
+                           params={"name": "get_item", "arguments": {}}),
+        ])
+
+        assert [response.id for response, _ in results] == [1, 2, 3]
+        assert "Item 1" in results[0][0].result["content"][0]["text"]
+        assert len(results[1][0].result["tools"]) == 3
+        assert results[2][0].error.code == -32602  # INVALID_PARAMS
+        assert all(context.is_sealed for _, context in results)
+        assert len(transport.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_handle_batch_isolates_a_raising_member(self, mock_adapter, monkeypatch):
+        """A member whose handler raises fails alone; its siblings still answer."""
+        adapter, transport = mock_adapter
+
+        async def broken(request, context):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(adapter, "_dispatch", {**adapter._dispatch, "initialize": broken})
+
+        results = await adapter.handle_batch([
+            JsonRpcRequest(id=1, method="tools/call",
+                           params={"name": "create_item", "arguments": {"name": "x"}}),
+            JsonRpcRequest(id=2, method="initialize"),
+            JsonRpcRequest(id=3, method="tools/list"),
+        ])
+
+        assert not results[0][0].result["isError"]
+        assert isinstance(results[1], GatewayInternalFailure)
+        assert len(results[2][0].result["tools"]) == 3
+        assert len(transport.requests) == 1
+
+    def test_canonical_args_ignore_key_order(self):
+        assert json_codec.dumps_canonical({"b": 1, "a": "x"}) == b'{"a":"x","b":1}'
+        assert json_codec.dumps_canonical({"a": "x", "b": 1}) == b'{"a":"x","b":1}'
+
+    def test_compact_dumps_matches_stdlib(self):
+        data = {"b": [1, 2], "a": "caf\u00e9", "n": 2**70}
+        assert json_codec.dumps(data) == json.dumps(
+            data, separators=(",", ":"), ensure_ascii=False
+        )
+
+    def test_canonical_args_handle_big_ints(self):
+        """orjson rejects >64-bit ints; the key must still be computable."""
+        assert json_codec.dumps_canonical({"id": 2**70}) == b'{"id":%d}' % 2**70
+
+    @pytest.mark.asyncio
+    async def test_concurrent_posts_are_not_coalesced(self, mock_adapter):
+        """Mutating calls always reach upstream, even when identical."""
+        adapter, transport = mock_adapter
+
+        await asyncio.gather(
+            *(adapter._call_tool("create_item", {"name": "x"}) for _ in range(3))
+        )
+
+        assert len(transport.requests) == 3
+
     @pytest.mark.asyncio
     async def test_call_tool_with_path_param(self, mock_adapter):
         adapter, transport = mock_adapter
@@ -612,6 +939,45 @@ class TestRestToMcpAdapter:
         # Verify the path was constructed correctly
         assert transport.requests[-1].url.path == "/items/1"
 
+    @pytest.mark.asyncio
+    async def test_call_tool_omits_empty_query_and_body(self, mock_adapter):
+        """No declared values → no query string and no request body."""
+        adapter, transport = mock_adapter
+        await adapter._call_tool("get_items", {})
+
+        sent = transport.requests[-1]
+        assert sent.url.query == b""
+        assert sent.content == b""
+        assert "content-type" not in sent.headers
+
+    @pytest.mark.asyncio
+    async def test_call_tool_with_multiple_path_params(self):
+        """Multi-placeholder templates are filled in one pass, in order."""
+        transport = MockTransport({"/users/3/posts/7/comments": (200, [])})
+        adapter = RestToMcpAdapter(
+            base_url="https://api.example.com",
+            endpoints=[
+                RestEndpoint(
+                    name="get_post_comments",
+                    path="/users/{userId}/posts/{postId}/comments",
+                    method=HttpMethod.GET,
+                    description="Get comments on a user's post",
+                    path_params=["userId", "postId"],
+                ),
+            ],
+        )
+        adapter._client = httpx.AsyncClient(
+            base_url="https://api.example.com",
+            transport=transport,
+        )
+
+        result = await adapter._call_tool(
+            "get_post_comments", {"postId": "7", "userId": "3"}
+        )
+
+        assert not result.isError
+        assert transport.requests[-1].url.path == "/users/3/posts/7/comments"
+
     @pytest.mark.asyncio
     async def test_call_tool_unknown_tool(self, mock_adapter):
         """Unknown tool raises ContractViolation (ambiguity hard-fail)."""
@@ -629,6 +995,116 @@ class TestRestToMcpAdapter:
         # 404 responses should set isError=True
         assert result.isError
 
+    def test_response_to_content_passes_json_through(self, mock_adapter):
+        """Default: upstream JSON text is returned verbatim, not re-encoded."""
+        adapter, _ = mock_adapter
+        response = httpx.Response(
+            200,
+            content=b'{"id":1, "name":"Item 1"}',
+            headers={"content-type": "application/json; charset=utf-8"},
+        )
+
+        content = adapter._response_to_content(response)
+
+        assert content[0].text == '{"id":1, "name":"Item 1"}'
+
+    def test_response_to_content_pretty_prints_json(self, mock_adapter):
+        adapter, _ = mock_adapter
+        adapter.pretty = True
+        response = httpx.Response(200, json={"id": 1, "name": "Item 1"})
+
+        content = adapter._response_to_content(response)
+
+        assert content[0].text == '{\n  "id": 1,\n  "name": "Item 1"\n}'
+
+    def test_response_to_content_pretty_keeps_wide_integers_exact(self, mock_adapter):
+        adapter, _ = mock_adapter
+        adapter.pretty = True
+        response = httpx.Response(200, json={"id": 123456789012345678901234567890})
+
+        content = adapter._response_to_content(response)
+
+        assert content[0].text == '{\n  "id": 123456789012345678901234567890\n}'
+
+    def test_response_to_content_pretty_invalid_utf8_falls_back_to_text(self, mock_adapter):
+        adapter, _ = mock_adapter
+        adapter.pretty = True
+        response = httpx.Response(
+            200, content=b'{"a":"\xff"}', headers={"content-type": "application/json"}
+        )
+
+        content = adapter._response_to_content(response)
+
+        assert content[0].text == response.text
+
+    @pytest.mark.asyncio
+    async def test_endpoint_pretty_overrides_adapter_default(self):
+        transport = MockTransport({"/items": (200, {"id": 1})})
+        adapter = RestToMcpAdapter(
+            base_url="https://api.example.com",
+            endpoints=[
+                RestEndpoint(
+                    name="get_items",
+                    path="/items",
+                    method=HttpMethod.GET,
+                    description="Get all items",
+                    pretty=True,
+                ),
+            ],
+        )
+        adapter._client = httpx.AsyncClient(
+            base_url="https://api.example.com",
+            transport=transport,
+        )
+
+        result = await adapter._call_tool("get_items", {})
+
+        assert result.content[0].text == '{\n  "id": 1\n}'
+
+    def test_response_to_content_pretty_without_orjson(self, mock_adapter, monkeypatch):
+        """The stdlib fallback produces the same text as orjson."""
+        adapter, _ = mock_adapter
+        adapter.pretty = True
+        response = httpx.Response(200, json={"id": 1, "name": "Caf\u00e9"})
+        expected = adapter._response_to_content(response)[0].text
+
+        monkeypatch.setattr(json_codec, "orjson", None)
+
+        assert adapter._response_to_content(response)[0].text == expected
+
+    def test_response_to_content_pretty_skips_parse_for_non_json_type(self, mock_adapter):
+        """Content-type decides: JSON-looking text/plain is not re-indented."""
+        adapter, _ = mock_adapter
+        adapter.pretty = True
+        response = httpx.Response(
+            200, content=b'{"id":1}', headers={"content-type": "text/plain"}
+        )
+
+        content = adapter._response_to_content(response)
+
+        assert content[0].text == '{"id":1}'
+
+    def test_response_to_content_error_body_not_reformatted(self, mock_adapter):
+        adapter, _ = mock_adapter
+        adapter.pretty = True
+        response = httpx.Response(
+            404,
+            content=b'{"error":"Not found"}',
+            headers={"content-type": "application/json"},
+        )
+
+        content = adapter._response_to_content(response)
+
+        assert content[0].text == '{"error":"Not found"}'
+
+    def test_response_to_content_non_json_falls_back_to_text(self, mock_adapter):
+        adapter, _ = mock_adapter
+        response = httpx.Response(200, text="<html>not json</html>")
+
+        content = adapter._response_to_content(response)
+
+        assert content[0].text == "<html>not json</html>"
+
     @pytest.mark.asyncio
     async def test_handle_request_initialize(self, mock_adapter):
         adapter, _ = mock_adapter
@@ -673,6 +1149,18 @@ class TestRestToMcpAdapter:
         assert len(context.results) == 1
         assert context.is_sealed  # Context must be sealed on return
 
+    @pytest.mark.parametrize(
+        "content",
+        [
+            [TextContent(text="a"), TextContent(text="b")],
+            [TextContent(text="a"), ImageContent(data="aGk=", mimeType="image/png")],
+            [],
+        ],
+    )
+    def test_tool_call_result_dump_matches_model_dump(self, content):
+        result = ToolCallResult(content=content, isError=True)
+        assert _dump_tool_call_result(result) == result.model_dump()
+
     @pytest.mark.asyncio
     async def test_handle_request_unknown_method(self, mock_adapter):
         adapter, _ = mock_adapter
@@ -696,6 +1184,31 @@ class TestRestToMcpAdapter:
         assert response.error.code == -32602  # INVALID_PARAMS
         assert context.is_sealed  # Context must be sealed even on error
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"name": 123, "arguments": {}},
+            {"name": "get_items", "arguments": ["not", "a", "dict"]},
+            {"name": "get_items", "arguments": None},
+            {"arguments": {}},
+            # extra="forbid": unknown fields must not slip past the fast path
+            {"name": "get_items", "arguments": {}, "extra": True},
+            {"name": "get_items", "arguments": {1: "non-str key"}},
+        ],
+    )
+    async def test_handle_request_malformed_tool_call_params(self, mock_adapter, params):
+        """Params outside the ToolCallParams schema are rejected, not coerced."""
+        adapter, transport = mock_adapter
+        request = JsonRpcRequest(id=6, method="tools/call", params=params)
+
+        response, context = await adapter.handle_request(request)
+
+        assert response.error.code == -32602  # INVALID_PARAMS
+        assert response.error.message.startswith("Invalid params:")
+        assert transport.requests == []
+        assert context.is_sealed
+
     @pytest.mark.asyncio
     async def test_call_tool_is_dumb_executor(self, mock_adapter):
         """call_tool does NOT validate - it's a dumb executor."""
@@ -746,6 +1259,167 @@ class TestRestToMcpAdapter:
         assert len(context.results) == 0
 
 
+# -----------------------------------------------------------------------------
+# Response Cache Tests
+# -----------------------------------------------------------------------------
+
+
+class TestResponseCache:
+    """Tests for the LRU + TTL cache on read-only tools."""
+
+    @pytest.fixture
+    def cached_adapter(self):
+        """Adapter with get_item cached and get_items uncached."""
+        adapter = RestToMcpAdapter(
+            base_url="https://api.example.com",
+            endpoints=[
+                RestEndpoint(
+                    name="get_items",
+                    path="/items",
+                    method=HttpMethod.GET,
+                    description="Get all items",
+                ),
+                RestEndpoint(
+                    name="get_item",
+                    path="/items/{id}",
+                    method=HttpMethod.GET,
+                    description="Get item by ID",
+                    path_params=["id"],
+                ),
+                RestEndpoint(
+                    name="create_item",
+                    path="/items",
+                    method=HttpMethod.POST,
+                    description="Create item",
+                    body_params=["name"],
+                ),
+            ],
+            cache_config=RestCacheConfig(allowlist=frozenset({"get_item"})),
+        )
+        transport = MockTransport({
+            "/items": (200, [{"id": 1}]),
+            "/items/1": (200, {"id": 1}),
+            "/items/2": (200, {"id": 2}),
+            "/items/999": (404, {"error": "Not found"}),
+        })
+        adapter._client = httpx.AsyncClient(
+            base_url="https://api.example.com",
+            transport=transport,
+        )
+        return adapter, transport
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_upstream(self, cached_adapter):
+        adapter, transport = cached_adapter
+
+        first = await adapter._call_tool("get_item", {"id": "1"})
+        second = await adapter._call_tool("get_item", {"id": "1"})
+
+        assert len(transport.requests) == 1
+        assert second == first
+
+    @pytest.mark.asyncio
+    async def test_tools_outside_allowlist_not_cached(self, cached_adapter):
+        adapter, transport = cached_adapter
+
+        await adapter._call_tool("get_items", {})
+        await adapter._call_tool("get_items", {})
+
+        assert len(transport.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_error_responses_not_cached(self, cached_adapter):
+        adapter, transport = cached_adapter
+
+        await adapter._call_tool("get_item", {"id": "999"})
+        await adapter._call_tool("get_item", {"id": "999"})
+
+        assert len(transport.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_mutation_clears_cache(self, cached_adapter):
+        adapter, transport = cached_adapter
+
+        await adapter._call_tool("get_item", {"id": "1"})
+        await adapter._call_tool("create_item", {"name": "x"})
+        await adapter._call_tool("get_item", {"id": "1"})
+
+        assert len(transport.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_read_racing_a_mutation_is_not_cached(self, cached_adapter):
+        """A GET that started before a mutation must not store its stale result."""
+        adapter, transport = cached_adapter
+        original = transport.handle_async_request
+        read_sent = asyncio.Event()
+        mutation_done = asyncio.Event()
+
+        async def racing_handle(request: httpx.Request) -> httpx.Response:
+            if request.method == "GET":
+                # Answer with the pre-mutation state, but only after the
+                # mutation has completed
+                response = await original(request)
+                read_sent.set()
+                await mutation_done.wait()
+                return response
+            transport.responses["/items/1"] = (200, {"id": 1, "v": 2})
+            return await original(request)
+
+        transport.handle_async_request = racing_handle
+
+        read = asyncio.create_task(adapter._call_tool("get_item", {"id": "1"}))
+        await read_sent.wait()
+        await adapter._call_tool("create_item", {"name": "x"})
+        mutation_done.set()
+        await read
+
+        fresh = await adapter._call_tool("get_item", {"id": "1"})
+
+        assert '"v":2' in fresh.content[0].text
+        assert len(transport.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_refetched(self, cached_adapter, monkeypatch):
+        adapter, transport = cached_adapter
+        await adapter._call_tool("get_item", {"id": "1"})
+
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now + 301)
+        await adapter._call_tool("get_item", {"id": "1"})
+
+        assert len(transport.requests) == 2
+
+    def test_lru_evicts_oldest(self):
+        cache = ResponseCache(RestCacheConfig(max_entries=2))
+        a, b, c = ("t", b'{"id":"a"}'), ("t", b'{"id":"b"}'), ("t", b'{"id":"c"}')
+        cache.put(a, [TextContent(text="a")])
+        cache.put(b, [TextContent(text="b")])
+        cache.get(a)  # a is now most recent
+        cache.put(c, [TextContent(text="c")])
+
+        assert cache.get(b) is None
+        assert cache.get(a) is not None
+        assert cache.get(c) is not None
+
+    def test_per_tool_ttl_overrides_default(self, monkeypatch):
+        config = RestCacheConfig(ttl_seconds=300, tool_ttls={"weather": 60.0})
+        cache = ResponseCache(config)
+        assert cache.accepts("weather")
+
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        cache.put(("weather", b"{}"), [TextContent(text="w")])
+        cache.put(("other", b"{}"), [TextContent(text="o")])
+
+        monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+        assert cache.get(("weather", b"{}")) is None
+        assert cache.get(("other", b"{}")) is not None
+
+    def test_disabled_by_default(self):
+        adapter = RestToMcpAdapter(base_url="https://api.example.com")
+        assert adapter._cache is None
+
+
 # -----------------------------------------------------------------------------
 # JSONPlaceholder Endpoints Tests
 # -----------------------------------------------------------------------------
@@ -781,6 +1455,12 @@ class TestJsonPlaceholderEndpoints:
 class TestMultiApiSupport:
     """Tests for multi-API composition feature."""
 
+    @pytest.mark.parametrize("code", [0, 1, 4, 99, 100, -1, 1.0])
+    def test_weather_description_matches_code_table(self, code):
+        """The dense lookup table agrees with WMO_WEATHER_CODES everywhere."""
+        expected = WMO_WEATHER_CODES.get(code, f"Weather code {code}")
+        assert get_weather_description(code) == expected
+
     def test_open_meteo_endpoints_defined(self):
         from rest_to_mcp.endpoints import OPEN_METEO_ENDPOINTS
         assert len(OPEN_METEO_ENDPOINTS) == 2
@@ -828,6 +1508,52 @@ class TestMultiApiSupport:
         # The endpoint should have its own base_url
         assert endpoint.base_url == "https://api.open-meteo.com"
 
+    @pytest.mark.asyncio
+    async def test_all_origins_share_the_pooled_client(self):
+        """
+        Absolute URLs for other APIs go through the same AsyncClient.
+
+        httpx pools connections per origin inside one client, so each host
+        keeps its own keep-alive/HTTP/2 connections without a client per host.
+        """
+        transport = MockTransport({
+            "/users/1": (200, {"id": 1}),
+            "/v1/forecast": (200, {"current": {}}),
+        })
+        adapter = RestToMcpAdapter(
+            base_url="https://jsonplaceholder.example.com",
+            endpoints=[
+                RestEndpoint(
+                    name="get_user",
+                    path="/users/{id}",
+                    method=HttpMethod.GET,
+                    description="Get user",
+                    path_params=["id"],
+                ),
+                RestEndpoint(
+                    name="get_weather",
+                    path="/v1/forecast",
+                    method=HttpMethod.GET,
+                    description="Get weather",
+                    base_url="https://weather.example.com",
+                ),
+            ],
+        )
+        client = httpx.AsyncClient(
+            base_url="https://jsonplaceholder.example.com",
+            transport=transport,
+        )
+        adapter._client = client
+
+        await adapter._call_tool("get_user", {"id": "1"})
+        await adapter._call_tool("get_weather", {})
+
+        assert [r.url.host for r in transport.requests] == [
+            "jsonplaceholder.example.com",
+            "weather.example.com",
+        ]
+        assert adapter._client is client
+
 
 # -----------------------------------------------------------------------------
 # Domain Adapter Isolation Tests
@@ -1030,3 +1756,43 @@ class TestPlaygroundDataFlow:
         # Should include a query that will fail (user 999 doesn't exist)
         error_demo = [q for q in EXAMPLE_QUERIES if "999" in q]
         assert len(error_demo) == 1, "Should have one error demo query with non-existent user"
+
+    def test_plan_waves_groups_independent_steps(self):
+        from rest_to_mcp.playground import SCENARIOS, plan_waves
+
+        waves = {s.id: plan_waves(s.steps) for s in SCENARIOS}
+        # get_user and get_posts both use only the regex capture
+        assert waves["user_posts"] == [[0, 1]]
+        # get_weather reads $result.0, so it must wait for get_user
+        assert waves["user_weather"] == [[0], [1]]
+
+    def test_plan_waves_splits_only_on_references_into_current_wave(self):
+        from rest_to_mcp.playground import ScenarioStep, plan_waves
+
+        steps = [
+            ScenarioStep(tool="a", args_template={}, label="a"),
+            ScenarioStep(tool="b", args_template={"x": "$result.0.id"}, label="b"),
+            ScenarioStep(tool="c", args_template={"y": "$result.0.id"}, label="c"),
+            ScenarioStep(tool="d", args_template={"z": "$result.2.id"}, label="d"),
+        ]
+        assert plan_waves(steps) == [[0], [1, 2], [3]]
+
+
+class TestBenchmarkStream:
+    """Tests for the chunked benchmark generators behind the dashboard."""
+
+    def test_stream_yields_running_stats_per_chunk(self):
+        from rest_to_mcp.benchmarks import PAYLOADS, benchmark_python_stream
+
+        stream = benchmark_python_stream(PAYLOADS["simple"], "simple", 250, warmup=0, chunk=100)
+        progress = []
+        try:
+            while True:
+                progress.append(next(stream))
+        except StopIteration as stop:
+            result = stop.value
+
+        assert [p["ops"] for p in progress] == [100, 200, 250]
+        assert all(p["ops_per_sec_running"] > 0 for p in progress)
+        assert result.parser == "python"
+        assert result.iterations == 250
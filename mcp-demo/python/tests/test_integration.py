@@ -242,6 +242,49 @@ class TestServerIntegration:
         assert "error" in data
         assert data["error"]["code"] == -32600  # INVALID_REQUEST
 
+    @pytest.mark.asyncio
+    async def test_mcp_invalid_request_echoes_id(self, client):
+        """Schema violations still report the caller's request id."""
+        response = await client.post(
+            "/mcp",
+            json={"jsonrpc": "2.0", "id": 9, "method": "tools/list", "extra": 1},
+        )
+
+        data = response.json()
+        assert data["error"]["code"] == -32600  # INVALID_REQUEST
+        assert data["id"] == 9
+
+    @pytest.mark.asyncio
+    async def test_mcp_invalid_request_with_nan(self, client):
+        """A schema violation whose body only pydantic can parse is still INVALID_REQUEST."""
+        response = await client.post(
+            "/mcp",
+            content='{"jsonrpc":"2.0","id":1,"method":5,"x":NaN}',
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["error"]["code"] == -32600  # INVALID_REQUEST
+        assert data["id"] == 1
+
+    @pytest.mark.asyncio
+    async def test_mcp_invalid_request_echoes_only_valid_ids(self, client):
+        """Wide integer ids are echoed exactly; malformed ids are answered with null."""
+        wide_id = 123456789012345678901234567890
+        for body, expected_id in (
+            ('{"jsonrpc":"2.0","id":%d,"method":5}' % wide_id, wide_id),
+            ('{"jsonrpc":"2.0","id":1.5,"method":"initialize"}', None),
+        ):
+            response = await client.post(
+                "/mcp", content=body, headers={"Content-Type": "application/json"}
+            )
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["error"]["code"] == -32600  # INVALID_REQUEST
+            assert data["id"] == expected_id
+
     @pytest.mark.asyncio
     async def test_mcp_unknown_method(self, client):
         """Verify unknown method error."""
@@ -254,3 +297,78 @@ class TestServerIntegration:
         data = response.json()
         assert "error" in data
         assert data["error"]["code"] == -32601  # METHOD_NOT_FOUND
+
+    @pytest.mark.asyncio
+    async def test_mcp_batch_preserves_order(self, client):
+        """A JSON array is a JSON-RPC batch; responses come back in order."""
+        response = await client.post(
+            "/mcp",
+            json=[
+                {"jsonrpc": "2.0", "id": 1, "method": "initialize"},
+                {"invalid": "request", "id": 2},
+                {"jsonrpc": "2.0", "id": 3, "method": "tools/list"},
+            ],
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["id"] for item in data] == [1, 2, 3]
+        assert "protocolVersion" in data[0]["result"]
+        assert data[1]["error"]["code"] == -32600  # INVALID_REQUEST
+        assert len(data[2]["result"]["tools"]) == 10
+
+    @pytest.mark.asyncio
+    async def test_mcp_batch_keeps_wide_ids_and_drops_malformed_ones(self, client):
+        """Ids beyond 64 bits survive; non-int/str ids are answered with a null id."""
+        wide_id = 123456789012345678901234567890
+        response = await client.post(
+            "/mcp",
+            content=(
+                '[{"jsonrpc":"2.0","id":%d,"method":"initialize"},'
+                '{"jsonrpc":"2.0","id":1.5,"method":"initialize"},'
+                '{"jsonrpc":"2.0","id":[1],"method":"initialize"}]' % wide_id
+            ),
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data[0]["id"] == wide_id
+        assert "protocolVersion" in data[0]["result"]
+        assert [item["id"] for item in data[1:]] == [None, None]
+        assert all(item["error"]["code"] == -32600 for item in data[1:])  # INVALID_REQUEST
+
+    @pytest.mark.asyncio
+    async def test_mcp_empty_batch(self, client):
+        """An empty batch is an invalid request, answered with a single error."""
+        response = await client.post("/mcp", json=[])
+
+        data = response.json()
+        assert data["error"]["code"] == -32600  # INVALID_REQUEST
+
+    @pytest.mark.asyncio
+    async def test_mcp_batch_isolates_a_raising_member(self, client, monkeypatch):
+        """A member whose handler raises gets INTERNAL_ERROR; siblings still answer."""
+        from rest_to_mcp import server
+
+        async def broken(request, context):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(
+            server.adapter, "_dispatch", {**server.adapter._dispatch, "initialize": broken}
+        )
+
+        response = await client.post(
+            "/mcp",
+            json=[
+                {"jsonrpc": "2.0", "id": 1, "method": "initialize"},
+                {"jsonrpc": "2.0", "id": 2, "method": "tools/list"},
+            ],
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["id"] for item in data] == [1, 2]
+        assert data[0]["error"]["code"] == -32603  # INTERNAL_ERROR
+        assert data[0]["error"]["data"]["failure_category"] == "internal_failure"
+        assert len(data[1]["result"]["tools"]) == 10
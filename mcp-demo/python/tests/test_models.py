@@ -12,6 +12,7 @@ from rest_to_mcp.models import (
     ContextError,
     ErrorCode,
     ExecutionContext,
+    ImageContent,
     JsonRpcErrorResponse,
     JsonRpcRequest,
     JsonRpcResponse,
@@ -84,6 +85,13 @@ class TestJsonRpcErrorResponse:
         assert response.error.code == -32601
         assert "Unknown method" in response.error.message
 
+    def test_error_code_stored_as_plain_int(self):
+        response = make_error_response(1, ErrorCode.INTERNAL_ERROR, "boom")
+        assert type(response.error.code) is int
+        assert response.model_dump_json().startswith(
+            '{"jsonrpc":"2.0","id":1,"error":{"code":-32603,'
+        )
+
     def test_error_with_null_id(self):
         response = make_error_response(
             request_id=None,
@@ -146,6 +154,18 @@ class TestToolModels:
         assert content.type == "text"
         assert content.text == "Hello, world!"
 
+    def test_content_blocks_dispatch_on_type_tag(self):
+        result = ToolCallResult.model_validate({
+            "content": [
+                {"type": "image", "data": "aGk=", "mimeType": "image/png"},
+                {"type": "text", "text": "hi"},
+            ]
+        })
+        assert [type(c) for c in result.content] == [ImageContent, TextContent]
+
+        with pytest.raises(ValidationError, match="union_tag_invalid"):
+            ToolCallResult.model_validate({"content": [{"type": "audio"}]})
+
 
 class TestExecutionContext:
     """
@@ -343,22 +363,47 @@ class TestExecutionContext:
         assert len(updated.results) == 1
         assert context is not updated
 
+    def test_derived_contexts_keep_identity_and_timestamp(self):
+        """with_* copies carry request identity and created_at over unchanged."""
+        request = JsonRpcRequest(id="req-1", method="tools/call")
+        original = ExecutionContext.from_request(request)
+        result = ToolCallResult(content=[TextContent(text="data")])
+
+        derived = original.with_tool_call("test", {"id": "1"}).with_result(result)
+
+        assert derived.request_id == "req-1"
+        assert derived.method == "tools/call"
+        assert derived.arguments == {"id": "1"}
+        assert derived.created_at == original.created_at
+        assert not derived.is_sealed
+
     # -------------------------------------------------------------------------
     # Defensive copying
     # -------------------------------------------------------------------------
 
-    def test_arguments_returns_copy(self):
-        """arguments property must return a copy to prevent mutation."""
+    def test_arguments_are_read_only(self):
+        """arguments property must not allow mutation of the context."""
         request = JsonRpcRequest(id=1, method="tools/call")
         context = ExecutionContext.from_request(request)
         context = context.with_tool_call("test", {"key": "value"})
 
         args = context.arguments
-        args["key"] = "modified"
+        with pytest.raises(TypeError):
+            args["key"] = "modified"  # type: ignore[index]
 
         # Original should be unchanged
         assert context.arguments["key"] == "value"
 
+    def test_with_tool_call_copies_caller_arguments(self):
+        """Mutating the caller's dict afterwards must not reach the context."""
+        request = JsonRpcRequest(id=1, method="tools/call")
+        arguments = {"key": "value"}
+        context = ExecutionContext.from_request(request).with_tool_call("test", arguments)
+
+        arguments["key"] = "modified"
+
+        assert context.arguments["key"] == "value"
+
     # -------------------------------------------------------------------------
     # Repr for debugging
     # -------------------------------------------------------------------------